@@ -0,0 +1,14 @@
+"""Helpers shared by the NumPy-based analyses (See Also, near duplicates, link graph)."""
+
+import re
+
+TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+def load_numpy(feature: str):
+    """Import numpy on demand; builds that skip ``feature`` never load it."""
+    try:
+        import numpy
+    except ImportError as exc:
+        raise SystemExit(f"{feature} needs the 'numpy' package (pip install numpy)") from exc
+    return numpy
@@ -0,0 +1,67 @@
+"""Compare ``wikiwrap.wrap_text`` with ``textwrap.fill`` on generated summaries.
+
+Summaries come from a synthetic corpus (``--synthetic`` topics per category),
+so the input mirrors what a large build wraps. Besides timings the script
+reports how many paragraphs differ between the two wrappers: with
+``keep_links=False`` there must be none, and with link-safe wrapping only
+paragraphs where ``textwrap`` would split a ``[[...]]`` link may differ.
+
+Usage: ``python scripts/bench_wrap.py [--synthetic N] [--repeat R]``
+"""
+
+import argparse
+import sys
+import textwrap
+import time
+
+from build_pages import CATEGORY_PAGE_DATA, build_article_summary, build_category_page_data, categories, synthesize_categories
+from wikiwrap import wrap_text
+
+
+def best_time(function, texts: list[str], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for text in texts:
+            function(text)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(argv: list[str]) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--synthetic", type=int, default=800, metavar="N", help="topics per category (default: 800)")
+    parser.add_argument("--width", type=int, default=90)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    if args.synthetic:
+        page_data = build_category_page_data(synthesize_categories(categories, args.synthetic))
+    else:
+        page_data = CATEGORY_PAGE_DATA
+    texts = [
+        build_article_summary(cat_name, page["title"], page["topic"])
+        for cat_name, pages in page_data.items()
+        for page in pages
+    ]
+
+    def reference(text: str) -> str:
+        return textwrap.fill(text, width=args.width)
+
+    def link_safe(text: str) -> str:
+        return wrap_text(text, width=args.width)
+
+    def identical(text: str) -> str:
+        return wrap_text(text, width=args.width, keep_links=False)
+
+    baseline = best_time(reference, texts, args.repeat)
+    print(f"{len(texts)} summaries, width {args.width}, best of {args.repeat}")
+    print(f"  textwrap.fill              {baseline:8.3f}s")
+    for label, function in (("wrap_text", link_safe), ("wrap_text(keep_links=False)", identical)):
+        elapsed = best_time(function, texts, args.repeat)
+        differing = sum(function(text) != reference(text) for text in texts)
+        print(f"  {label:<26} {elapsed:8.3f}s  {baseline / elapsed:5.1f}x  {differing} paragraphs differ")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,130 @@
+"""Build metrics in the OpenMetrics text format.
+
+The generator records per-page render and write latency, how many pages
+each category produced and how many bytes actually changed on disk, then
+writes everything as one exposition file. The file is replaced atomically,
+so a textfile collector (e.g. node_exporter's ``--collector.textfile``)
+never scrapes a half-written file.
+"""
+
+import bisect
+import time
+
+from page_writer import replace_file
+
+PREFIX = "wiki_build"
+LATENCY_BUCKETS = (0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0)
+
+
+def escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def format_value(value: float) -> str:
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Histogram:
+    def __init__(self, buckets: tuple[float, ...] = LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def samples(self, name: str) -> list[str]:
+        lines = []
+        cumulative = 0
+        for bound, count in zip(self.buckets, self.counts):
+            cumulative += count
+            lines.append(f'{name}_bucket{{le="{bound}"}} {cumulative}')
+        lines.append(f'{name}_bucket{{le="+Inf"}} {self.count}')
+        lines.append(f"{name}_count {self.count}")
+        lines.append(f"{name}_sum {format_value(self.sum)}")
+        return lines
+
+
+class BuildMetrics:
+    """Counters and latency histograms for one generator run."""
+
+    def __init__(self):
+        self.started = time.monotonic()
+        self.pages_rendered: dict[str, int] = {}
+        self.pages_written = 0
+        self.pages_unchanged = 0
+        self.bytes_written = 0
+        self.render_seconds = Histogram()
+        self.write_seconds = Histogram()
+        self.render_cache: dict[str, int] | None = None
+
+    def record_page(self, category: str | None, render_seconds: float, write_seconds: float, size: int, changed: bool | None) -> None:
+        """Record one page; ``changed`` is None when the write happens later and is counted with ``record_writes``."""
+        label = category or ""
+        self.pages_rendered[label] = self.pages_rendered.get(label, 0) + 1
+        self.render_seconds.observe(render_seconds)
+        self.write_seconds.observe(write_seconds)
+        if changed is None:
+            return
+        if changed:
+            self.pages_written += 1
+            self.bytes_written += size
+        else:
+            self.pages_unchanged += 1
+
+    def record_writes(self, written: int, unchanged: int, size: int) -> None:
+        self.pages_written += written
+        self.pages_unchanged += unchanged
+        self.bytes_written += size
+
+    def record_render_cache(self, hits: int, misses: int, evicted: int) -> None:
+        self.render_cache = {"hits": hits, "misses": misses, "evictions": evicted}
+
+    def exposition(self) -> str:
+        name = PREFIX
+        lines = [
+            f"# TYPE {name}_pages_rendered counter",
+            f"# HELP {name}_pages_rendered Pages rendered, by category (empty for general, static and template pages).",
+            *(
+                f'{name}_pages_rendered_total{{category="{escape_label(category)}"}} {count}'
+                for category, count in sorted(self.pages_rendered.items())
+            ),
+            f"# TYPE {name}_pages_written counter",
+            f"# HELP {name}_pages_written Pages whose content changed and was written.",
+            f"{name}_pages_written_total {self.pages_written}",
+            f"# TYPE {name}_pages_unchanged counter",
+            f"# HELP {name}_pages_unchanged Pages skipped because the stored copy was already identical.",
+            f"{name}_pages_unchanged_total {self.pages_unchanged}",
+            f"# TYPE {name}_written_bytes counter",
+            f"# HELP {name}_written_bytes Uncompressed bytes of the pages that were written.",
+            f"{name}_written_bytes_total {self.bytes_written}",
+            *(
+                line
+                for result, count in (self.render_cache or {}).items()
+                for line in (
+                    f"# TYPE {name}_render_cache_{result} counter",
+                    f"# HELP {name}_render_cache_{result} Persistent render cache {result}.",
+                    f"{name}_render_cache_{result}_total {count}",
+                )
+            ),
+            f"# TYPE {name}_render_seconds histogram",
+            f"# HELP {name}_render_seconds Time to render one page.",
+            *self.render_seconds.samples(f"{name}_render_seconds"),
+            f"# TYPE {name}_write_seconds histogram",
+            f"# HELP {name}_write_seconds Time to compare and stage one page for writing.",
+            *self.write_seconds.samples(f"{name}_write_seconds"),
+            f"# TYPE {name}_duration_seconds gauge",
+            f"# HELP {name}_duration_seconds Wall time of the whole build.",
+            f"{name}_duration_seconds {format_value(time.monotonic() - self.started)}",
+            f"# TYPE {name}_last_success_timestamp_seconds gauge",
+            f"# HELP {name}_last_success_timestamp_seconds Unix time the build finished.",
+            f"{name}_last_success_timestamp_seconds {format_value(time.time())}",
+            "# EOF",
+        ]
+        return "\n".join(lines) + "\n"
+
+    def write(self, path: str) -> None:
+        replace_file(path, self.exposition().encode("utf-8"))
@@ -1,1176 +1,1073 @@
+import argparse
+import hashlib
+import json
 import os
-import textwrap
-from collections import defaultdict
+import random
+import shutil
+import sys
+import time
+import zlib
+from functools import lru_cache
+from typing import NamedTuple
+
+from build_metrics import BuildMetrics
+from html_site import html_path, normalize_title, render_site
+from memory_budget import MemoryTracker, parse_size
+from page_compression import (
+    COMPRESSED_SUFFIXES,
+    DICTIONARY_FILENAME,
+    PageCompressor,
+    load_compression_settings,
+    save_compression_settings,
+    train_zstd_dictionary,
+)
+from page_ingest import PageFields, ingest_pages, parse_page
+from page_model import (
+    Bold,
+    BulletList,
+    CategoryTag,
+    Heading,
+    Link,
+    MarkdownRenderer,
+    MediaWikiRenderer,
+    NumberedList,
+    Paragraph,
+    Raw,
+    ShortDescription,
+    TableOfContents,
+    Template,
+    Text,
+    link_resolver,
+    parse_inline,
+    render,
+    to_wikitext,
+)
+from page_reader import content_matches, scan_pages
+from page_writer import AtomicPageWriter, remove_stale_temporaries, replace_file, swap_tree
+from render_cache import RenderCache
+from wiki_data import CATEGORY_2BZ_DESCRIPTION, GENERAL_PAGES, NAVBOX_TEMPLATE_CONTENT, SUMMARY_TEMPLATES, categories
+from wikiwrap import wrap_text
 
 ROOT = os.path.join(os.path.dirname(__file__), "..", "pages")
 
 # Utility helpers
 
+FILENAME_TRANSLATION = str.maketrans({"/": "-", ":": "_", " ": "_"})
+
+
 def sanitize_filename(name: str) -> str:
-    sanitized = name.replace("/", "-")
-    sanitized = sanitized.replace(":", "_")
-    sanitized = sanitized.replace(" ", "_")
-    return sanitized
+    return name.translate(FILENAME_TRANSLATION)
 
 
 def ensure_dir(path: str) -> None:
     os.makedirs(path, exist_ok=True)
 
 
-def write_page(path: str, content: str) -> None:
-    ensure_dir(os.path.dirname(path))
-    with open(path, "w", encoding="utf-8") as handle:
-        handle.write(content.strip() + "\n")
-
-
-def build_article_content(title: str, category: str, summary: str, see_also: list[str]) -> str:
-    short_description = summary.split(".")[0]
-    see_also_links = "\n".join(f"* [[{link}]]" for link in see_also)
-    objectives = textwrap.dedent(
-        f"""
-        # Review the [[Category:{category}|{category}]] standards that apply to {title}.
-        # Apply the guidance at your current base and log results on the [[Player Support Hub]].
-        # Share feedback with teammates via in-game chat or the community channels.
-        """
-    ).strip()
-    strategies = textwrap.dedent(
-        f"""
-        * Focus on how '''{title}''' supports long-term progress on [[play.2bz.org]].
-        * Combine this guidance with insights from [[2bZ Server Overview]] and [[Quick Access Portal]].
-        * Align preparation with travel routes listed in [[Transport Planner Hub]].
-        """
-    ).strip()
-    collaboration = textwrap.dedent(
-        f"""
-        Players document their findings on '''{title}''' to keep the [[Community Showcase Index]] current. Coordinate with nearby builders, scouts, and logisticians so the whole faction benefits from the refined workflow.
-        """
-    ).strip()
-    content = f"""
-{{{{Short description|{short_description}}}}}
-= {title} =
-{{{{2bZ Navbox}}}}
-__TOC__
-
-== Overview ==
-{textwrap.fill(summary, width=90)}
-
-== Core Strategies ==
-{strategies}
-
-== Action Checklist ==
-{objectives}
-
-== Collaboration Opportunities ==
-{textwrap.fill(collaboration, width=90)}
-
-== See Also ==
-{see_also_links}
-
-[[Category:{category}]]
-[[Category:2bZ Wiki]]
-"""
-    return textwrap.dedent(content).strip()
+def page_bytes(content: str) -> bytes:
+    return (content.strip() + "\n").encode("utf-8")
+
+
+def verify_pages(root: str, specs: list["PageSpec"]) -> dict[str, list[str]]:
+    """Compare rendered pages with the tree on disk without writing anything."""
+    report = {"changed": [], "missing": [], "unexpected": []}
+    expected = set()
+    for spec in specs:
+        path = os.path.join(root, spec.path)
+        expected.add(os.path.normpath(path))
+        if not os.path.exists(path):
+            report["missing"].append(spec.path)
+        elif not content_matches(path, page_bytes(render_page(spec))):
+            report["changed"].append(spec.path)
+    for entry in scan_pages(root):
+        if os.path.normpath(entry.path) not in expected:
+            report["unexpected"].append(os.path.relpath(entry.path, root))
+    return report
+
+
+def article_document(
+    title: str,
+    category: str,
+    summary: str,
+    see_also: list[str],
+    short_description: str | None = None,
+    extra_categories: tuple[str, ...] = (),
+) -> list:
+    return article_body_document(
+        title,
+        category,
+        short_description if short_description is not None else summary.split(".")[0],
+        [Paragraph(parse_inline(paragraph), width=90) for paragraph in summary.split("\n\n")],
+        BulletList([[Link(link)] for link in see_also]),
+        extra_categories,
+    )
+
+
+def article_body_document(
+    title: str,
+    category: str,
+    short_description: str,
+    overview: list,
+    see_also: object,
+    extra_categories: tuple[str, ...] = (),
+) -> list:
+    return [
+        ShortDescription(short_description),
+        Heading(1, [Text(title)]),
+        Template("2bZ Navbox"),
+        TableOfContents(True),
+        Heading(2, [Text("Overview")]),
+        *overview,
+        Heading(2, [Text("Core Strategies")]),
+        BulletList([
+            [Text("Focus on how "), Bold(title), Text(" supports long-term progress on "), Link("play.2bz.org"), Text(".")],
+            [Text("Combine this guidance with insights from "), Link("2bZ Server Overview"), Text(" and "), Link("Quick Access Portal"), Text(".")],
+            [Text("Align preparation with travel routes listed in "), Link("Transport Planner Hub"), Text(".")],
+        ]),
+        Heading(2, [Text("Action Checklist")]),
+        NumberedList([
+            [Text("Review the "), Link(f"Category:{category}", category), Text(f" standards that apply to {title}.")],
+            [Text("Apply the guidance at your current base and log results on the "), Link("Player Support Hub"), Text(".")],
+            [Text("Share feedback with teammates via in-game chat or the community channels.")],
+        ]),
+        Heading(2, [Text("Collaboration Opportunities")]),
+        Paragraph(
+            [
+                Text("Players document their findings on "),
+                Bold(title),
+                Text(" to keep the "),
+                Link("Community Showcase Index"),
+                Text(" current. Coordinate with nearby builders, scouts, and logisticians so the whole faction benefits from the refined workflow."),
+            ],
+            width=90,
+        ),
+        Heading(2, [Text("See Also")]),
+        see_also,
+        CategoryTag(category),
+        CategoryTag("2bZ Wiki"),
+        *(CategoryTag(extra) for extra in extra_categories),
+    ]
+
+
+def build_article_content(
+    title: str,
+    category: str,
+    summary: str,
+    see_also: list[str],
+    short_description: str | None = None,
+    extra_categories: tuple[str, ...] = (),
+) -> str:
+    return to_wikitext(article_document(title, category, summary, see_also, short_description, extra_categories))
+
+
+ARTICLE_TEMPLATE_PARAMETERS = ("title", "category", "short_description", "overview", "see_also")
+
+
+def build_article_template() -> str:
+    """Render the article scaffolding once, with parameters in place of the page values."""
+    title, category, short_description, overview, see_also = (f"{{{{{{{name}}}}}}}" for name in ARTICLE_TEMPLATE_PARAMETERS)
+    body = to_wikitext(article_body_document(title, category, short_description, [Paragraph([Text(overview)], width=90)], Raw(see_also)))
+    return f"""<includeonly>{body}</includeonly><noinclude>
+{{{{Documentation|content=Shared layout for generated guide articles. Parameters: {", ".join(ARTICLE_TEMPLATE_PARAMETERS)}.}}}}
+</noinclude>"""
+
+
+def build_article_transclusion(
+    title: str,
+    category: str,
+    summary: str,
+    see_also: list[str],
+    short_description: str | None = None,
+    extra_categories: tuple[str, ...] = (),
+) -> str:
+    values = {
+        "title": title,
+        "category": category,
+        "short_description": short_description if short_description is not None else summary.split(".")[0],
+        "overview": "\n\n".join(wrap_text(paragraph, width=90) for paragraph in summary.split("\n\n")),
+        "see_also": "\n".join(f"* [[{link}]]" for link in see_also),
+    }
+    params = "\n".join(f"|{name}={values[name]}" for name in ARTICLE_TEMPLATE_PARAMETERS)
+    tags = "".join(f"\n[[Category:{extra}]]" for extra in extra_categories)
+    return f"{{{{2bZ Article\n{params}\n}}}}{tags}"
+
+
+def category_header(short_description: str, title: str) -> list:
+    return [ShortDescription(short_description), Heading(1, [Text(title)]), Template("2bZ Navbox"), TableOfContents(False)]
+
+
+def category_document(category: str, description: str, pages: list[str]) -> list:
+    return [
+        *category_header(f"Overview of the {category} pages on the 2bZ wiki", f"Category:{category}"),
+        Paragraph(parse_inline(description)),
+        Heading(2, [Text("Featured Pages")]),
+        BulletList([[Link(page)] for page in sorted(pages)]),
+        CategoryTag("2bZ Wiki"),
+    ]
 
 
 def build_category_content(category: str, description: str, pages: list[str]) -> str:
-    bullet_list = "\n".join(f"* [[{page}]]" for page in sorted(pages))
-    content = f"""
-{{{{Short description|Overview of the {category} pages on the 2bZ wiki}}}}
-= Category:{category} =
-{{{{2bZ Navbox}}}}
-__NOTOC__
+    return to_wikitext(category_document(category, description, pages))
 
-{description}
 
-== Featured Pages ==
-{bullet_list}
+def category_index_document(category: str, description: str, parts: list[str]) -> list:
+    return [
+        *category_header(f"Overview of the {category} pages on the 2bZ wiki", f"Category:{category}"),
+        Paragraph(parse_inline(description)),
+        Heading(2, [Text("Browse Pages")]),
+        BulletList([[Link(part)] for part in parts]),
+        CategoryTag("2bZ Wiki"),
+    ]
 
-[[Category:2bZ Wiki]]
-"""
-    return textwrap.dedent(content).strip()
 
+def build_category_index(category: str, description: str, parts: list[str]) -> str:
+    return to_wikitext(category_index_document(category, description, parts))
 
-def build_general_page(title: str, summary: str, sections: list[tuple[str, list[str]]]) -> str:
-    short_description = summary.split(".")[0]
-    sections_text = []
+
+def category_part_document(category: str, part_title: str, pages: list[str]) -> list:
+    return [
+        *category_header(f"{category} pages from {pages[0]} to {pages[-1]}", part_title),
+        Paragraph([Text("Part of the alphabetical index for "), Link(f":Category:{category}", category), Text(".")]),
+        Heading(2, [Text("Featured Pages")]),
+        BulletList([[Link(page)] for page in pages]),
+        CategoryTag("2bZ Wiki"),
+    ]
+
+
+def build_category_part(category: str, part_title: str, pages: list[str]) -> str:
+    return to_wikitext(category_part_document(category, part_title, pages))
+
+
+def root_category_document(description: str, category_names: tuple[str, ...]) -> list:
+    return [
+        *category_header("Umbrella category for all documentation on the 2bZ community wiki", "Category:2bZ Wiki"),
+        Paragraph(parse_inline(description)),
+        Heading(2, [Text("Primary Categories")]),
+        BulletList([[Link(f"Category:{name}")] for name in category_names]),
+        CategoryTag("2bZ Wiki"),
+    ]
+
+
+def build_root_category(description: str, category_names: tuple[str, ...]) -> str:
+    return to_wikitext(root_category_document(description, category_names))
+
+
+def paginate_titles(titles: list[str], page_size: int) -> list[list[str]]:
+    """Split sorted titles into alphabetical runs with content-defined boundaries.
+
+    Once a run holds half a page, it ends after the next title whose CRC32 is
+    divisible by half the page size, so runs average ``page_size`` entries
+    and each boundary depends on the titles themselves rather than on their
+    position in the list. Adding or removing a title usually rewrites only
+    the run it falls into (86% of single insertions into 5,000 titles at a
+    page size of 50). When it adds or removes a boundary, the rest of the
+    run can shift the boundaries after it, so occasionally several runs
+    change. Runs are capped at twice the page size.
+    """
+    half = max(1, page_size // 2)
+    parts, current = [], []
+    for title in titles:
+        current.append(title)
+        if len(current) >= 2 * page_size or (len(current) >= half and zlib.crc32(title.encode("utf-8")) % half == 0):
+            parts.append(current)
+            current = []
+    if current:
+        parts.append(current)
+    return parts
+
+
+def remove_stale_category_parts(root: str, specs: list["PageSpec"], suffixes: tuple[str, ...] = ("",)) -> list[str]:
+    """Delete sub-pages left in category index directories by earlier builds.
+
+    Sub-pages are named after their first title, so when a boundary moves a
+    part is written under a new name and the old file would linger. Each
+    category's ``categories/<name>/`` directory may only hold planned parts;
+    ``suffixes`` lists the variants written per page (e.g. ``.gz``).
+    """
+    planned = {os.path.normpath(os.path.join(root, spec.path)) for spec in specs}
+    removed = set()
+    for spec in specs:
+        if spec.kind not in ("category", "category_index"):
+            continue
+        directory = os.path.join(root, os.path.splitext(spec.path)[0])
+        for suffix in suffixes:
+            for entry in scan_pages(directory, ".mediawiki" + suffix):
+                page = entry.path[:len(entry.path) - len(suffix)]
+                if os.path.normpath(page) not in planned:
+                    os.remove(entry.path)
+                    removed.add(os.path.relpath(page, root))
+    return sorted(removed)
+
+
+def general_document(title: str, summary: str, sections: list[tuple[str, list[str]]]) -> list:
+    blocks = [
+        ShortDescription(summary.split(".")[0]),
+        Heading(1, [Text(title)]),
+        Template("2bZ Navbox"),
+        TableOfContents(True),
+        Paragraph(parse_inline(summary), width=90),
+    ]
     for heading, bullets in sections:
-        block = "\n".join(f"* {item}" for item in bullets)
-        sections_text.append(f"== {heading} ==\n{block}")
-    joined_sections = "\n\n".join(sections_text)
-    content = f"""
-{{{{Short description|{short_description}}}}}
-= {title} =
-{{{{2bZ Navbox}}}}
-__TOC__
-
-{textwrap.fill(summary, width=90)}
-
-{joined_sections}
-
-[[Category:2bZ Wiki]]
-"""
-    return textwrap.dedent(content).strip()
-
-
-categories = {
-    "Newcomer Guides": {
-        "description": "Guides that help new arrivals on play.2bz.org settle in, make smart first-day decisions, and integrate with the wider survival community.",
-        "topics": [
-            "Orientation Tour",
-            "Spawn Basics",
-            "Starter Kit Setup",
-            "First Night Survival",
-            "Safe Logout Practices",
-            "Community Chat Etiquette",
-            "Protecting Temporary Bases",
-            "Travel Safety Planning",
-            "Early Resource Priorities",
-            "Performance Optimization",
-            "Managing Hunger",
-            "Crafting Essentials",
-            "Tool Durability Planning",
-            "Respawn Planning",
-            "Secret Storage Options",
-            "Shared Resource Rooms",
-            "Anarchy Survival Mindset",
-            "Setting Personal Goals",
-            "Sustainable Progress Habits",
-        ],
-    },
-    "Quick Start Tutorials": {
-        "description": "Condensed tutorials for rapidly gearing up, securing loot, and joining community initiatives without delay.",
-        "topics": [
-            "Gathering Food Quickly",
-            "Building Shelter Fast",
-            "Iron Rush Mining",
-            "Portal Sprint Preparation",
-            "Enchanting Basics",
-            "Brewing Stand Setup",
-            "Villager Rescue Workflow",
-            "Boat Travel Mastery",
-            "Horse Taming Basics",
-            "Elytra Acquisition Prep",
-            "Ender Chest Setup",
-            "Trading Hall Basics",
-            "XP Farming Quickstart",
-            "Shield Mastery",
-            "Armor Upgrade Path",
-            "Weapon Enchantment Path",
-            "Potion Loadout Planning",
-            "Travel Kit Packing",
-            "Emergency Escape Plans",
-        ],
-    },
-    "Survival Handbook": {
-        "description": "Long-form survival references for thriving through harsh weather, mob-packed nights, and long expeditions across 2bZ.",
-        "topics": [
-            "Long-Term Food Security",
-            "Waterway Navigation",
-            "Weather Preparedness",
-            "Base Camouflage",
-            "Inventory Management",
-            "Night Patrol Routines",
-            "Underground Shelter Design",
-            "Surface Scouting",
-            "Seasonal Migration Plans",
-            "Supply Cache Networks",
-            "Remote Farming",
-            "Sustainable Mining Routes",
-            "Endurance Travel",
-            "Emergency Medical Supplies",
-            "Fire Resistance Planning",
-            "Raid Response",
-            "Backup Gear Kits",
-            "Signal Beacon Usage",
-            "Safehouse Rotation",
-        ],
-    },
-    "Combat Academy": {
-        "description": "PvP tactics, training regimens, and combat-ready loadouts for defending bases and contesting objectives.",
-        "topics": [
-            "Swordplay Fundamentals",
-            "Axe Combat Tactics",
-            "Bow Control Drills",
-            "Crossbow Ambushes",
-            "Shield Counterplay",
-            "Potion Duels",
-            "Totem Management",
-            "Gapple Timing",
-            "Trident Combat",
-            "Crystal PvP Basics",
-            "Anchor Trap Planning",
-            "Team Fight Formations",
-            "Potion Splash Support",
-            "Arena Training Layouts",
-            "Gear Repair Cycles",
-            "Escape and Pursuit",
-            "Obsidian Box Defense",
-            "End Crystal Etiquette",
-            "Debuff Management",
-        ],
-    },
-    "Resource Gathering": {
-        "description": "Resource acquisition plans for every major material needed to maintain mega-projects and faction stockpiles.",
-        "topics": [
-            "Iron Ore Routes",
-            "Coal Vein Mapping",
-            "Diamond Hunt Strategy",
-            "Redstone Prospecting",
-            "Gold Rush Planning",
-            "Lapis Lazuli Runs",
-            "Emerald Trading Routes",
-            "Ancient Debris Recovery",
-            "Quartz Harvesting",
-            "Netherite Upgrade Prep",
-            "Clay Collection",
-            "Sand Quarry Operations",
-            "Gravel Dredging",
-            "Obsidian Harvest",
-            "Ice Gathering",
-            "Wood Farm Rotation",
-            "Wool Harvesting",
-            "Mob Loot Stockpiles",
-            "Alchemy Ingredient Runs",
-        ],
-    },
-    "Building Styles": {
-        "description": "Architectural references that highlight the server's most popular design languages and how to replicate them.",
-        "topics": [
-            "Modern Spawn Builds",
-            "Medieval Fortresses",
-            "Underground Hideouts",
-            "Skybase Concepts",
-            "Ocean Monument Renovations",
-            "Desert Oasis Retreats",
-            "Forest Village Homesteads",
-            "Mountain Strongholds",
-            "Floating Island Retreats",
-            "Ruined City Aesthetic",
-            "Industrial Complexes",
-            "Steampunk Workshops",
-            "Minimalist Survival Bases",
-            "High-Tech Labs",
-            "Futuristic Transit Hubs",
-            "Organic Terraformed Bases",
-            "Lore Museum Layouts",
-            "PvP Arena Architecture",
-            "Community Marketplaces",
-        ],
-    },
-    "Infrastructure Projects": {
-        "description": "Large-scale logistical builds that keep travel, trading, and communications functioning smoothly across 2bZ.",
-        "topics": [
-            "Overworld Highway Grid",
-            "Nether Highway Upkeep",
-            "Spawn Bypass Routes",
-            "Portal Hub Engineering",
-            "Map Art Galleries",
-            "Public Farm Nexus",
-            "Waypoint Obelisks",
-            "Storage Array Planning",
-            "Rail System Expansion",
-            "Ice Boat Expressways",
-            "Beacon Pyramid Network",
-            "Border Watchposts",
-            "Logistics Command Centers",
-            "Resupply Depot Layouts",
-            "Emergency Shelter Chain",
-            "Underground Transit Lines",
-            "Signal Tower Network",
-            "End Gateway Integration",
-            "Maintenance Scheduling",
-        ],
-    },
-    "Farms & Automation": {
-        "description": "Automated farms that fuel faction war chests and keep day-to-day necessities stocked.",
-        "topics": [
-            "Auto Wheat Farm",
-            "Carrot Harvest Cycle",
-            "Potato Yield Optimizer",
-            "Melon and Pumpkin Stack",
-            "Sugar Cane Array",
-            "Bamboo Furnace Fuel",
-            "Kelp Smelting Loop",
-            "Mob Grinder Layout",
-            "Guardian Farm Operations",
-            "Wither Skeleton Farm",
-            "Iron Golem Foundry",
-            "Gold Piglin Farm",
-            "Blaze Rod Refinery",
-            "Shulker Shell Loop",
-            "Raid Farm Scheduling",
-            "Villager Crop Farm",
-            "Honeycomb Production",
-            "Wool Color Matrix",
-            "Moss Block Mulcher",
-        ],
-    },
-    "Redstone Mechanics": {
-        "description": "Redstone devices, circuitry explanations, and component libraries for builders of every skill level.",
-        "topics": [
-            "Redstone Clock Library",
-            "Observer Pulse Chains",
-            "Piston Door Catalog",
-            "Secret Entrance Logic",
-            "Chunk Loader Basics",
-            "Flying Machine Variants",
-            "Item Sorter Arrays",
-            "Signal Strength Math",
-            "Comparator Tricks",
-            "Hopper Line Optimization",
-            "Note Block Alerts",
-            "Trap Design Principles",
-            "Elevator Blueprints",
-            "Hidden Stair Mechanisms",
-            "Pulse Extender Patterns",
-            "Toggle Latch Showcase",
-            "Wireless Redstone Concepts",
-            "Lag-Friendly Circuits",
-            "Testing Sandbox Setup",
-        ],
-    },
-    "Exploration Logs": {
-        "description": "Field notes and scouting reports from ambitious explorers charting the overworld beyond spawn.",
-        "topics": [
-            "Spawn Ring Survey",
-            "Jungle Expedition Report",
-            "Mesa Frontier Notes",
-            "Taiga Recon Log",
-            "Swampland Findings",
-            "Frozen Peaks Traverse",
-            "Savanna Trail Guide",
-            "Ocean Monument Recon",
-            "Mushroom Island Catalog",
-            "Deep Dark Expedition",
-            "Ancient City Findings",
-            "Lush Cave Survey",
-            "Badlands Ruin Mapping",
-            "Mega Taiga Archives",
-            "Dripstone Cavern Notes",
-            "Sunken Ship Registry",
-            "Village Network Mapping",
-            "Stronghold Watchlist",
-            "Rare Structure Sighting",
-        ],
-    },
-    "Nether Expeditions": {
-        "description": "Strategies and maps for navigating the Nether safely while controlling blaze, wither skeleton, and piglin encounters.",
-        "topics": [
-            "Nether Spawn Hub Guide",
-            "Bastion Reconnaissance",
-            "Fortress Control Plan",
-            "Crimson Forest Logistics",
-            "Warped Forest Safety",
-            "Soul Sand Valley Prep",
-            "Basalt Delta Navigation",
-            "Piglin Trading Outposts",
-            "Strider Ferry Routes",
-            "Lava Lake Crossings",
-            "Nether Roof Access",
-            "Ancient Debris Scouting",
-            "Wither Hunt Camps",
-            "Blaze Spawner Tactics",
-            "Ender Pearl Collection",
-            "Nether Weathering Plan",
-            "Portal Link Calibration",
-            "Return Route Safeguards",
-            "Resource Cache Locations",
-        ],
-    },
-    "End Dimension Strategies": {
-        "description": "Long-term End planning, from gateway linking to chorus farm layouts and raid staging grounds.",
-        "topics": [
-            "End Spawn Platform Safety",
-            "Gateway Ring Mapping",
-            "Elytra Expedition Routes",
-            "Outer End Settlements",
-            "Shulker Combat Guide",
-            "Chorus Farm Design",
-            "Dragon Fight Reset",
-            "Enderman XP Hub",
-            "Void Safety Measures",
-            "Obsidian Pillar Mining",
-            "Return Portal Logistics",
-            "End City Loot Routing",
-            "End Gateway Transit",
-            "Enderman Proofing",
-            "End Ship Salvage",
-            "Dragon Egg Archive",
-            "Falling Hazard Mitigation",
-            "End Biome Catalog",
-            "Ender Chest Supply Chain",
-        ],
-    },
-    "Economy Systems": {
-        "description": "Documentation of the barter, gift, and trade systems that keep supplies circulating despite the anarchy setting.",
-        "topics": [
-            "Barter Kit Templates",
-            "Supply Drop Protocols",
-            "Donation Chest Etiquette",
-            "Resource Share Tracking",
-            "Collective Farm Funding",
-            "Infrastructure Sponsorships",
-            "Repair Service Pricing",
-            "Map Art Marketplace",
-            "Bounty Board Operations",
-            "Logistics Contracting",
-            "Auction Event Planning",
-            "Loan Ledger Basics",
-            "Material Exchange Rates",
-            "Emergency Aid Network",
-            "Restock Reminder System",
-            "Trading Season Calendar",
-            "Philanthropy Highlights",
-            "Community Currency Concepts",
-            "Inventory Audit Process",
-        ],
-    },
-    "Trading Outposts": {
-        "description": "Profiles of trusted trade hubs, negotiation tips, and the safeguards they rely on to stay open.",
-        "topics": [
-            "Spawn Market Plaza",
-            "Northern Ice Bazaar",
-            "Desert Caravan Stop",
-            "Jungle Treehouse Exchange",
-            "Mesa Freight Station",
-            "Taiga Timber Depot",
-            "Swamp Apothecary",
-            "Mountain Forge Quarter",
-            "Coastal Fishery Hub",
-            "Skyport Trade Ring",
-            "Ender Market Loop",
-            "Nether Anchor Exchange",
-            "Crimson Caravanserai",
-            "Warped Grove Emporium",
-            "Soul Valley Trading Post",
-            "Basalt Delta Depot",
-            "Piglin Pact Embassy",
-            "Outlands Relay Station",
-            "Hidden Black Market",
-        ],
-    },
-    "Factions & Diplomacy": {
-        "description": "Histories and operating procedures for long-standing factions, alliances, and peace accords across the server.",
-        "topics": [
-            "Founders Council Charter",
-            "Spawn Guardians Pact",
-            "Highway Collective",
-            "Atlas Cartographers",
-            "Night Watch Sentinels",
-            "Redstone Syndicate",
-            "Skybuilders League",
-            "Lorekeepers Union",
-            "Nomad Fellowship",
-            "Farmers Cooperative",
-            "Artisans Assembly",
-            "Vanguard Militia",
-            "Archivist Circle",
-            "Nether Navigators",
-            "Endfarer Alliance",
-            "Peacekeeper Mediation",
-            "Logistics Bureau",
-            "Builders Accord",
-            "Settlement Treaties",
-        ],
-    },
-    "Community Events": {
-        "description": "Seasonal showcases, competitions, and collaborative projects that bring the server together.",
-        "topics": [
-            "Spawn Festival",
-            "Highway Repair Week",
-            "Map Art Expo",
-            "PvP Invitational",
-            "Build Battle Series",
-            "Lore Quest Marathon",
-            "Treasure Hunt Circuit",
-            "Charity Resource Drive",
-            "Speedrun Showdown",
-            "Elytra Race Cup",
-            "Fishing Derby",
-            "Redstone Fair",
-            "Parkour Challenge",
-            "Nether Sprint Rally",
-            "End Expedition Relay",
-            "Community Awards Night",
-            "Storytelling Fireside",
-            "Holiday Build Jam",
-            "Anniversary Celebration",
-        ],
-    },
-    "History & Lore": {
-        "description": "Recorded history, legendary moments, and server folklore kept alive by dedicated archivists.",
-        "topics": [
-            "Server Founding Story",
-            "First Highway Era",
-            "Rise of the Guardians",
-            "Nether Roof Opening",
-            "Dragon Cycle Chronicles",
-            "Great Map Art Wave",
-            "Age of Expeditions",
-            "Factions Peace Summit",
-            "Economic Renaissance",
-            "The Wither Incursion",
-            "End Gateway Rush",
-            "Cultural Archives",
-            "Redstone Revolution",
-            "Infrastructure Golden Age",
-            "Builder Renaissance",
-            "Portal Network Saga",
-            "Settlement Diaspora",
-            "Modernization Timeline",
-            "Future Visions",
-        ],
-    },
-    "Landmarks & Regions": {
-        "description": "Point-of-interest dossiers covering megabuilds, natural wonders, and remote installations.",
-        "topics": [
-            "Spawn Obelisk Plaza",
-            "Old Capital Ruins",
-            "Crystal Ridge Keep",
-            "Mushroom Coast Refuge",
-            "Frostwall Citadel",
-            "Emberstone Bastion",
-            "Verdant Basin",
-            "Sunspire Canyon",
-            "Azurewind Harbor",
-            "Obsidian Sanctuary",
-            "Whispering Pines",
-            "Shattered Mesa",
-            "Gilded Savannah",
-            "Luminous Caverns",
-            "Voidwatch Outpost",
-            "Skylight Sanctum",
-            "Golem Valley",
-            "Starfall Observatory",
-            "Endwatch Bastion",
-        ],
-    },
-    "Player Settlements": {
-        "description": "Active bases and player-led communities, with onboarding info, rules of engagement, and visiting hours.",
-        "topics": [
-            "Spawn Commons",
-            "Northwatch Hamlet",
-            "Sunrise Station",
-            "Deepwood Enclave",
-            "Sandsea Collective",
-            "Cliffside Borough",
-            "Riverside Cooperative",
-            "Skyreach Commune",
-            "Frostgate Hamlet",
-            "Glowstone Market",
-            "Nether Refuge",
-            "End Frontier Camp",
-            "Nomad Encampment",
-            "Lagless Haven",
-            "Builder's Refuge",
-            "Archivist Sanctum",
-            "Vanguard Keep",
-            "Harvest Hollow",
-            "Beacon Heights",
-        ],
-    },
-    "Transportation Network": {
-        "description": "Blueprints and maintenance schedules for boats, rails, ice roads, and portal grids.",
-        "topics": [
-            "Overworld Canal System",
-            "River Lock Engineering",
-            "Ice Boat Speedway",
-            "Rail Junction Atlas",
-            "Horse Road Outposts",
-            "Waypoint Marker Guide",
-            "Nether Portal Registry",
-            "Gateway Alignment",
-            "Ender Pearl Staging",
-            "Skybridge Maintenance",
-            "Tunnel Boring Crew",
-            "Highway Lighting Plan",
-            "Rest Stop Amenities",
-            "Logistics Scheduling",
-            "Emergency Detours",
-            "Road Sign Standards",
-            "Repair Kit Logistics",
-            "Cartography Integration",
-            "Traffic Monitoring",
-        ],
-    },
-    "Technical Reference": {
-        "description": "Mechanics deep dives, server performance notes, and compatibility considerations for large projects.",
-        "topics": [
-            "Tick Rate Observations",
-            "Mob Cap Management",
-            "Chunk Loading Policy",
-            "Entity Cramming Tests",
-            "Redstone Lag Studies",
-            "Block Update Control",
-            "Simulation Distance Notes",
-            "Client Optimization",
-            "Server Hardware Profile",
-            "Backups and Restores",
-            "Version Upgrade Log",
-            "Plugin Compatibility",
-            "Command Reference",
-            "Data Pack Catalog",
-            "Anti-Grief Strategies",
-            "Performance Benchmarking",
-            "Bug Report Workflow",
-            "Testing Sandbox",
-            "Diagnostic Toolkit",
-        ],
-    },
-    "Quality of Life Tools": {
-        "description": "Mods, settings, and optional enhancements that improve readability and reduce grind while respecting server rules.",
-        "topics": [
-            "Client Settings Checklist",
-            "Minimal HUD Setup",
-            "Resource Pack Library",
-            "Sound Tuning Guide",
-            "Performance Mod Profiles",
-            "Macro Policy Overview",
-            "Replay Mod Usage",
-            "Coordinate Tracking",
-            "Waypoint Mods",
-            "Inventory Tweaks",
-            "Chat Filter Tools",
-            "Lighting Enhancements",
-            "Accessibility Options",
-            "Screenshot Workflow",
-            "Build Planning Apps",
-            "Spawn Alert Systems",
-            "AFK Notification Setup",
-            "Cloud Backup Tips",
-            "Device Sync Planning",
-        ],
-    },
-    "Server Policies": {
-        "description": "Codified expectations that keep gameplay fair, respectful, and creatively focused.",
-        "topics": [
-            "Community Charter",
-            "Reporting Workflow",
-            "Ban Appeal Guide",
-            "Chat Conduct Rules",
-            "Build Respect Etiquette",
-            "Duplication Policy",
-            "Client Modification Rules",
-            "PvP Engagement Rules",
-            "Map Art Attribution",
-            "Lore Canon Guidelines",
-            "Infrastructure Stewardship",
-            "Event Hosting Policy",
-            "Collaboration Etiquette",
-            "New Player Mentoring",
-            "Resource Claim Etiquette",
-            "Security Incident Plan",
-            "Content Creation Policy",
-            "Privacy and Data Use",
-            "Dispute Resolution Steps",
-        ],
-    },
-    "Staff & Governance": {
-        "description": "Internal procedures, escalation charts, and the volunteer roles that keep the network stable.",
-        "topics": [
-            "Staff Roles Overview",
-            "Admin Duty Roster",
-            "Moderator Playbook",
-            "Support Ticket Flow",
-            "Community Liaison Tasks",
-            "Event Team Procedures",
-            "Technical Operations",
-            "Infrastructure Maintenance",
-            "Security Response",
-            "Training Curriculum",
-            "Onboarding New Staff",
-            "Staff Code of Conduct",
-            "Communication Standards",
-            "Audit Trail Logging",
-            "Incident Review",
-            "Volunteer Recognition",
-            "Feedback Collection",
-            "Public Reports",
-            "Transparency Dashboard",
-        ],
-    },
-}
+        blocks.append(Heading(2, [Text(heading)]))
+        blocks.append(BulletList([parse_inline(item) for item in bullets]))
+    blocks.append(CategoryTag("2bZ Wiki"))
+    return blocks
+
+
+def build_general_page(title: str, summary: str, sections: list[tuple[str, list[str]]]) -> str:
+    return to_wikitext(general_document(title, summary, sections))
+
+
+def article_title(cat_name: str, topic: str) -> str:
+    title = f"{cat_name[:-1] if cat_name.endswith('s') else cat_name}: {topic}" if cat_name in {"Farms & Automation", "Server Policies"} else f"{cat_name[:-1] if cat_name.endswith('s') else cat_name} Guide: {topic}"
+    # Custom naming for certain categories to avoid awkward titles
+    if cat_name == "Building Styles":
+        title = f"Building Style: {topic}"
+    elif cat_name == "Infrastructure Projects":
+        title = f"Infrastructure Project: {topic}"
+    elif cat_name == "Farms & Automation":
+        title = f"Farm Build: {topic}"
+    elif cat_name == "Redstone Mechanics":
+        title = f"Redstone Mechanic: {topic}"
+    elif cat_name == "Exploration Logs":
+        title = f"Exploration Log: {topic}"
+    elif cat_name == "Nether Expeditions":
+        title = f"Nether Expedition: {topic}"
+    elif cat_name == "End Dimension Strategies":
+        title = f"End Strategy: {topic}"
+    elif cat_name == "Economy Systems":
+        title = f"Economy System: {topic}"
+    elif cat_name == "Trading Outposts":
+        title = f"Trading Outpost: {topic}"
+    elif cat_name == "Factions & Diplomacy":
+        title = f"Faction Dossier: {topic}"
+    elif cat_name == "Community Events":
+        title = f"Community Event: {topic}"
+    elif cat_name == "History & Lore":
+        title = f"History & Lore: {topic}"
+    elif cat_name == "Landmarks & Regions":
+        title = f"Landmark Profile: {topic}"
+    elif cat_name == "Player Settlements":
+        title = f"Settlement Profile: {topic}"
+    elif cat_name == "Transportation Network":
+        title = f"Transportation Route: {topic}"
+    elif cat_name == "Technical Reference":
+        title = f"Technical Brief: {topic}"
+    elif cat_name == "Quality of Life Tools":
+        title = f"QoL Tool: {topic}"
+    elif cat_name == "Server Policies":
+        title = f"Policy Guide: {topic}"
+    elif cat_name == "Staff & Governance":
+        title = f"Governance Record: {topic}"
+    elif cat_name == "Newcomer Guides":
+        title = f"Newcomer Guide: {topic}"
+    elif cat_name == "Quick Start Tutorials":
+        title = f"Quick Start: {topic}"
+    elif cat_name == "Survival Handbook":
+        title = f"Survival Handbook: {topic}"
+    elif cat_name == "Combat Academy":
+        title = f"Combat Academy: {topic}"
+    elif cat_name == "Resource Gathering":
+        title = f"Resource Guide: {topic}"
+    return title
+
+
+def build_category_page_data(categories: dict) -> dict[str, list[dict[str, str]]]:
+    page_data = {}
+    for cat_name, data in categories.items():
+        for topic in data["topics"]:
+            page_data.setdefault(cat_name, []).append({"title": article_title(cat_name, topic), "topic": topic})
+    return page_data
+
+
+CATEGORY_PAGE_DATA = build_category_page_data(categories)
+
+
+# Synthetic corpus
+
+def synthesize_categories(categories: dict, topics_per_category: int, seed: int = 0) -> dict:
+    """Expand every category to ``topics_per_category`` topics for stress testing.
+
+    The real topics are kept first; the remainder are recombined from words of
+    the category's own topics, so titles and summaries keep the shape of the
+    real corpus. Each category draws from its own generator seeded with
+    ``seed`` and the category name, which makes the output reproducible and
+    independent of the other categories.
+    """
+    synthetic = {}
+    for cat_name, data in categories.items():
+        rng = random.Random(f"{seed}:{cat_name}")
+        topics = list(data["topics"][:topics_per_category])
+        # Compare case-insensitively: "The Age" and "the Age" would share a file.
+        seen = {topic.casefold() for topic in topics}
+        words = sorted({word.casefold(): word for topic in data["topics"] for word in sorted(topic.split())}.values())
+        while len(topics) < topics_per_category:
+            candidate = " ".join(rng.sample(words, min(len(words), rng.randint(2, 3))))
+            if candidate.casefold() in seen:
+                candidate = f"{candidate} {len(topics)}"
+                if candidate.casefold() in seen:
+                    continue
+            seen.add(candidate.casefold())
+            topics.append(candidate)
+        synthetic[cat_name] = {**data, "topics": topics}
+    return synthetic
+
+
+# Page planning and rendering
+
+class PageSpec(NamedTuple):
+    """A single output page: its wiki title, output path and builder inputs."""
+
+    kind: str
+    title: str
+    category: str | None
+    path: str
+    args: tuple
+
+
+@lru_cache(maxsize=None)
+def category_slug(cat_name: str) -> str:
+    return sanitize_filename(cat_name.lower().replace(" & ", " and ").replace(" ", "-"))
+
+
+def build_article_summary(cat_name: str, title: str, topic: str) -> str:
+    topic_lower = topic.lower()
+    summary_template = SUMMARY_TEMPLATES.get(cat_name, "{title} captures collective knowledge about {topic_lower} for long-term archival.")
+    return summary_template.format(
+        title=title,
+        topic=topic,
+        topic_lower=topic_lower,
+        category=cat_name,
+    ).strip() + " This entry links back to [[Category:{category}|{category}]] for additional context.".format(category=cat_name)
+
+
+def plan_pages(
+    categories: dict,
+    page_data: dict,
+    general_pages: dict,
+    transclude: bool = False,
+    category_page_size: int | None = None,
+    see_also_map: dict[str, list[str]] | None = None,
+) -> list[PageSpec]:
+    """List every page in write order without rendering any of them.
+
+    With ``transclude`` set, articles are emitted as calls to the shared
+    ``Template:2bZ Article`` instead of carrying the full scaffolding.
+    Categories with more than ``category_page_size`` members get an index
+    page plus alphabetical sub-pages instead of one long list. See Also
+    links come from ``see_also_map`` when given, otherwise from the next
+    titles in the same category.
+    """
+    article_kind = "article_transclusion" if transclude else "article"
+    specs = []
+    for cat_name, entries in page_data.items():
+        category_dir = os.path.join("articles", category_slug(cat_name))
+        titles = [entry["title"] for entry in entries]
+        for idx, entry in enumerate(entries):
+            title = entry["title"]
+            summary = build_article_summary(cat_name, title, entry["topic"])
+            if see_also_map is not None:
+                see_also = see_also_map[title]
+            else:
+                see_also = []
+                for offset in (1, 2, 3):
+                    see_title = titles[(idx + offset) % len(titles)]
+                    if see_title != title:
+                        see_also.append(see_title)
+            path = os.path.join(category_dir, sanitize_filename(title) + ".mediawiki")
+            specs.append(PageSpec(article_kind, title, cat_name, path, (title, cat_name, summary, see_also[:3])))
+
+    for cat_name, data in categories.items():
+        pages = [entry["title"] for entry in page_data[cat_name]]
+        path = os.path.join("categories", sanitize_filename(cat_name) + ".mediawiki")
+        if category_page_size is None or len(pages) <= category_page_size:
+            specs.append(PageSpec("category", f"Category:{cat_name}", cat_name, path, (cat_name, data["description"], pages)))
+            continue
+        part_titles = []
+        for part in paginate_titles(sorted(pages), category_page_size):
+            part_title = f"{cat_name} Index ({part[0]})"
+            part_titles.append(part_title)
+            part_path = os.path.join("categories", sanitize_filename(cat_name), sanitize_filename(part_title) + ".mediawiki")
+            specs.append(PageSpec("category_part", part_title, cat_name, part_path, (cat_name, part_title, part)))
+        specs.append(PageSpec("category_index", f"Category:{cat_name}", cat_name, path, (cat_name, data["description"], part_titles)))
+
+    for title, data in general_pages.items():
+        path = os.path.join("general", sanitize_filename(title) + ".mediawiki")
+        specs.append(PageSpec("general", title, None, path, (title, data["summary"], data["sections"])))
+
+    specs.append(PageSpec("root_category", "Category:2bZ Wiki", "2bZ Wiki", os.path.join("categories", "2bZ_Wiki.mediawiki"), (CATEGORY_2BZ_DESCRIPTION, tuple(categories))))
+    specs.append(PageSpec("static", "Template:2bZ Navbox", None, os.path.join("templates", "Template_2bZ_Navbox.mediawiki"), (NAVBOX_TEMPLATE_CONTENT,)))
+    if transclude:
+        specs.append(PageSpec("static", "Template:2bZ Article", None, os.path.join("templates", "Template_2bZ_Article.mediawiki"), (build_article_template(),)))
+    return specs
+
+
+def similarity_see_also(page_data: dict) -> dict[str, list[str]]:
+    from see_also import similar_see_also
+
+    documents = [
+        (entry["title"], f"{entry['topic']} {build_article_summary(cat_name, entry['title'], entry['topic'])}")
+        for cat_name, entries in page_data.items()
+        for entry in entries
+    ]
+    return similar_see_also(documents)
+
+
+NEAR_DUPLICATE_REPORT_LIMIT = 20
 
-GENERAL_PAGES = {
-    "Main Page": {
-        "summary": "Welcome hub for the 2bZ community wiki, featuring curated routes for builders, fighters, traders, and explorers.",
-        "sections": [
-            ("Start Here", [
-                "Visit [[Newcomer Guide: Orientation Tour]] for first-day orientation.",
-                "Review [[2bZ Server Overview]] to understand the survival philosophy.",
-                "Browse [[Quick Access Portal]] for role-specific shortcuts.",
-            ]),
-            ("Active Highlights", [
-                "Check [[Update & Patch Archive]] for the latest changelog.",
-                "Submit builds to [[Community Showcase Index]].",
-                "Coordinate travel via [[Transport Planner Hub]].",
-            ]),
-        ],
-    },
-    "2bZ Server Overview": {
-        "summary": "Snapshot of server identity, playstyle, and expectations on the long-running 2bZ survival network.",
-        "sections": [
-            ("Core Pillars", [
-                "Persistent survival world with community-driven infrastructure.",
-                "Cooperative focus where players self-govern and document standards.",
-                "Technical transparency through [[Technical Reference Index]].",
-            ]),
-            ("Related Guides", [
-                "[[Category:Server Policies]] for official expectations.",
-                "[[Community Governance Overview]] covering councils and volunteers.",
-                "[[Resource Planning Dashboard]] outlining logistical priorities.",
-            ]),
-        ],
-    },
-    "Quick Access Portal": {
-        "summary": "Role-based launcher offering curated shortcuts for builders, scouts, traders, and PvP specialists.",
-        "sections": [
-            ("Navigation", [
-                "Builders start with [[Build Inspiration Gallery]] and [[Infrastructure Control Center]].",
-                "Explorers browse [[Exploration Gateway]].",
-                "PvP teams review [[Competitive Play Hub]].",
-            ]),
-            ("Support", [
-                "Report issues through [[Player Support Hub]].",
-                "Use [[Contributor Guide]] for editing standards.",
-                "Plan events via [[Category:Community Events]].",
-            ]),
-        ],
-    },
-    "Server Timeline Overview": {
-        "summary": "High-level chronology referencing the major eras documented within [[History & Lore]] articles.",
-        "sections": [
-            ("Milestone Index", [
-                "[[Category:History & Lore]] curates era-specific writeups.",
-                "[[Update & Patch Archive]] logs version upgrades.",
-                "[[Community Governance Overview]] highlights leadership shifts.",
-            ]),
-            ("How to Contribute", [
-                "Submit sources on the talk pages of key history entries.",
-                "Coordinate interviews with veteran players via [[Player Support Hub]].",
-                "Flag timeline gaps for archivists in [[Contributor Guide]].",
-            ]),
-        ],
-    },
-    "Player Support Hub": {
-        "summary": "Centralized support center for reporting issues, requesting assistance, and accessing mentoring resources.",
-        "sections": [
-            ("Help Channels", [
-                "Escalate incidents through [[Governance Record: Staff Roles Overview]].",
-                "Consult [[Policy Guide: Reporting Workflow]] for formal submissions.",
-                "Join mentoring initiatives described in [[Policy Guide: New Player Mentoring]].",
-            ]),
-            ("Knowledge Base", [
-                "Link to [[Safety & Security Center]] for protective habits.",
-                "Review [[Contributor Guide]] before updating documentation.",
-                "Track resolutions via [[Governance Record: Transparency Dashboard]].",
-            ]),
-        ],
-    },
-    "Safety & Security Center": {
-        "summary": "Best practices for keeping accounts safe, reducing grief risk, and protecting valuables in an open survival environment.",
-        "sections": [
-            ("Account Safety", [
-                "Use unique passwords and enable account-level protections.",
-                "Avoid suspicious downloads and keep clients updated.",
-                "Report breaches promptly following [[Policy Guide: Security Incident Plan]].",
-            ]),
-            ("In-Game Security", [
-                "Hide bases using [[Survival Handbook: Base Camouflage]].",
-                "Rotate storage as outlined in [[Newcomer Guide: Secret Storage Options]].",
-                "Coordinate patrols via [[Survival Handbook: Night Patrol Routines]].",
-            ]),
-        ],
-    },
-    "Build Inspiration Gallery": {
-        "summary": "Curated showcase linking to standout architecture, terraforming, and public works across the server.",
-        "sections": [
-            ("Featured Styles", [
-                "[[Building Style: Modern Spawn Builds]] and [[Building Style: Steampunk Workshops]].",
-                "[[Building Style: Organic Terraformed Bases]] for landscape integration ideas.",
-                "[[Building Style: Community Marketplaces]] supporting trade hubs.",
-            ]),
-            ("Share Your Work", [
-                "Submit screenshots via [[Media Library]].",
-                "Document specs on relevant [[Category:Building Styles]] pages.",
-                "Coordinate tours through [[Category:Community Events]] listings.",
-            ]),
-        ],
-    },
-    "Competitive Play Hub": {
-        "summary": "Coordination point for PvP events, arena listings, and competitive training material.",
-        "sections": [
-            ("Training Guides", [
-                "Review [[Category:Combat Academy]] articles for drills.",
-                "Use [[Combat Academy: Arena Training Layouts]] to set up practice spaces.",
-                "Track gear maintenance using [[Combat Academy: Gear Repair Cycles]].",
-            ]),
-            ("Event Coordination", [
-                "Sign up for [[Community Event: PvP Invitational]].",
-                "Schedule scrims through [[Category:Community Events]] calendar.",
-                "Share match VODs in [[Media Library]].",
-            ]),
-        ],
-    },
-    "Exploration Gateway": {
-        "summary": "Explorer-focused landing page tying together scouting notes, survival plans, and structure dossiers.",
-        "sections": [
-            ("Plan Your Route", [
-                "Start with [[Exploration Log: Spawn Ring Survey]].",
-                "Log discoveries under [[Category:Exploration Logs]] entries.",
-                "Coordinate returns using [[Nether Expedition: Return Route Safeguards]].",
-            ]),
-            ("Support Resources", [
-                "Pack supplies listed in [[Survival Handbook: Endurance Travel]].",
-                "Share maps within [[Transportation Route: Cartography Integration]].",
-                "Archive findings at [[Community Showcase Index]].",
-            ]),
-        ],
-    },
-    "Resource Planning Dashboard": {
-        "summary": "Live-updated index mapping resource guides to ongoing megaproject requests and stockpile levels.",
-        "sections": [
-            ("Supply Priorities", [
-                "Coordinate with [[Category:Resource Gathering]] plans.",
-                "Automate harvests via [[Category:Farms & Automation]] guides.",
-                "Log deliveries at [[Infrastructure Project: Logistics Command Centers]].",
-            ]),
-            ("Project Support", [
-                "Check [[Category:Infrastructure Projects]] to match build needs.",
-                "Review [[Category:Economy Systems]] for sponsorship options.",
-                "Update records through [[Economy System: Inventory Audit Process]].",
-            ]),
-        ],
-    },
-    "Community Showcase Index": {
-        "summary": "Directory of featured builds, lore articles, and player achievements maintained by curators.",
-        "sections": [
-            ("Submit Features", [
-                "Nominate builds from [[Build Inspiration Gallery]].",
-                "Highlight stories from [[Category:History & Lore]].",
-                "Link video coverage in [[Media Library]].",
-            ]),
-            ("Archive Structure", [
-                "Organized by [[Category:Landmarks & Regions]].",
-                "Tag contributions with relevant [[Category]] pages.",
-                "Cross-reference faction efforts via [[Category:Factions & Diplomacy]].",
-            ]),
-        ],
-    },
-    "Infrastructure Control Center": {
-        "summary": "Operations board for monitoring major public works, maintenance queues, and expansion priorities.",
-        "sections": [
-            ("Key Networks", [
-                "[[Infrastructure Project: Overworld Highway Grid]] maintenance schedule.",
-                "[[Infrastructure Project: Portal Hub Engineering]] tasks.",
-                "[[Infrastructure Project: Signal Tower Network]] coverage map.",
-            ]),
-            ("Coordination", [
-                "Assign crews via [[Infrastructure Project: Logistics Command Centers]].",
-                "Log completed work in [[Infrastructure Project: Maintenance Scheduling]].",
-                "Forecast resources through [[Resource Planning Dashboard]].",
-            ]),
-        ],
-    },
-    "Transport Planner Hub": {
-        "summary": "Central routing planner for highways, waterways, flight corridors, and emergency detours.",
-        "sections": [
-            ("Routing Tools", [
-                "Consult [[Transportation Route: Waypoint Marker Guide]].",
-                "Review [[Transportation Route: Emergency Detours]].",
-                "Sync with [[Transportation Route: Cartography Integration]].",
-            ]),
-            ("Traveler Support", [
-                "Check rest stops via [[Transportation Route: Rest Stop Amenities]].",
-                "Coordinate convoys through [[Transportation Route: Logistics Scheduling]].",
-                "Report hazards at [[Player Support Hub]].",
-            ]),
-        ],
-    },
-    "Technical Reference Index": {
-        "summary": "Master index linking to diagnostics, server metrics, and engineering briefs that inform large builds.",
-        "sections": [
-            ("Performance Monitoring", [
-                "Track ticks with [[Technical Brief: Tick Rate Observations]].",
-                "Mitigate lag via [[Technical Brief: Redstone Lag Studies]].",
-                "Coordinate tests in [[Technical Brief: Testing Sandbox]].",
-            ]),
-            ("Documentation", [
-                "Reference [[Technical Brief: Version Upgrade Log]].",
-                "Audit [[Technical Brief: Plugin Compatibility]].",
-                "Follow [[Technical Brief: Bug Report Workflow]].",
-            ]),
-        ],
-    },
-    "Media Library": {
-        "summary": "Media archive covering screenshots, cinematics, and timelines that highlight the 2bZ community.",
-        "sections": [
-            ("Content Types", [
-                "Screenshot submissions from [[Build Inspiration Gallery]].",
-                "Event footage tied to [[Category:Community Events]].",
-                "Lore documentaries referenced in [[Category:History & Lore]].",
-            ]),
-            ("Contribution Guidelines", [
-                "Follow attribution standards in [[Policy Guide: Content Creation Policy]].",
-                "Store metadata using [[Economy System: Inventory Audit Process]].",
-                "Report takedown requests via [[Player Support Hub]].",
-            ]),
-        ],
-    },
-    "Community Governance Overview": {
-        "summary": "Explainer covering councils, volunteer crews, and collaborative decision-making traditions on 2bZ.",
-        "sections": [
-            ("Governance Bodies", [
-                "[[Faction Dossier: Founders Council Charter]].",
-                "[[Faction Dossier: Logistics Bureau]].",
-                "[[Governance Record: Community Liaison Tasks]].",
-            ]),
-            ("Participation", [
-                "Attend forums advertised on [[Category:Community Events]].",
-                "Submit proposals via [[Governance Record: Transparency Dashboard]].",
-                "Track decisions in [[Governance Record: Incident Review]].",
-            ]),
-        ],
-    },
-    "Contributor Guide": {
-        "summary": "Editing playbook that keeps articles consistent, sourced, and easy to maintain.",
-        "sections": [
-            ("Editorial Standards", [
-                "Follow formatting from [[Main Page]].",
-                "Add categories like [[Category:Newcomer Guides]] where relevant.",
-                "Cite evidence from in-game screenshots or logs.",
-            ]),
-            ("Tools", [
-                "Use [[QoL Tool: Device Sync Planning]] to copy notes.",
-                "Track drafts in [[Technical Brief: Testing Sandbox]].",
-                "Coordinate merges via [[Governance Record: Staff Roles Overview]].",
-            ]),
-        ],
-    },
-    "Update & Patch Archive": {
-        "summary": "Rolling changelog summarizing plugin tweaks, content additions, and technical maintenance windows.",
-        "sections": [
-            ("How to Log Updates", [
-                "Record date, time, and summary for each patch.",
-                "Reference affected systems like [[Category:Infrastructure Projects]].",
-                "Link related bug tickets from [[Technical Brief: Bug Report Workflow]].",
-            ]),
-            ("Research", [
-                "Compare against [[Technical Brief: Version Upgrade Log]].",
-                "Highlight impacts to [[Category:Economy Systems]].",
-                "Notify players through [[Quick Access Portal]].",
-            ]),
-        ],
-    },
-}
 
-CATEGORY_SUMMARY_OVERRIDES = {
-    "Server Policies": "Overview of official policy, etiquette, and safety documentation for all participants.",
-    "Staff & Governance": "Internal governance documentation ensuring transparency and accountability.",
+def find_near_duplicate_topics(page_data: dict, threshold: float) -> list[list[tuple[str, str]]]:
+    """Group articles, across all categories, whose topic and summary nearly coincide.
+
+    Words every summary of a category shares (its template and title
+    prefix) are dropped before comparing, so two pages only match on what
+    their topics contribute. Returns clusters of ``(category, title)``.
+    """
+    from analysis_common import TOKEN_RE
+    from near_duplicates import near_duplicate_clusters
+
+    entries, documents = [], []
+    for cat_name, pages in page_data.items():
+        boilerplate = set(TOKEN_RE.findall(build_article_summary(cat_name, article_title(cat_name, ""), "").lower()))
+        for entry in pages:
+            summary = build_article_summary(cat_name, entry["title"], entry["topic"])
+            words = [word for word in TOKEN_RE.findall(summary.lower()) if word not in boilerplate]
+            entries.append((cat_name, entry["title"]))
+            documents.append(f"{entry['topic']} {' '.join(words)}")
+    return [[entries[index] for index in cluster] for cluster in near_duplicate_clusters(documents, threshold)]
+
+
+def drop_near_duplicates(page_data: dict, clusters: list[list[tuple[str, str]]]) -> dict:
+    """Keep the first article of every cluster and drop the rest."""
+    dropped = {member for cluster in clusters for member in cluster[1:]}
+    return {
+        cat_name: [entry for entry in pages if (cat_name, entry["title"]) not in dropped]
+        for cat_name, pages in page_data.items()
+    }
+
+
+ARTICLE_KINDS = ("article", "article_transclusion")
+# Hashes of the fields each article was last generated with; the base of the --keep-edits merge.
+GENERATED_FIELDS_FILENAME = ".generated-fields.json"
+MERGED_FIELDS = ("short_description", "overview", "see_also", "categories")
+
+
+def field_hashes(fields: PageFields) -> list[str]:
+    return [
+        hashlib.sha256(json.dumps(getattr(fields, name), ensure_ascii=False).encode("utf-8")).hexdigest()[:16]
+        for name in MERGED_FIELDS
+    ]
+
+
+def generated_field_hashes(specs: list[PageSpec]) -> dict[str, list[str]]:
+    return {spec.path: field_hashes(parse_page(render_page(spec))) for spec in specs if spec.kind in ARTICLE_KINDS}
+
+
+def load_generated_fields(output: str) -> dict[str, list[str]] | None:
+    try:
+        with open(os.path.join(output, GENERATED_FIELDS_FILENAME), encoding="utf-8") as handle:
+            return json.load(handle)
+    except FileNotFoundError:
+        return None
+
+
+def save_generated_fields(output: str, hashes: dict[str, list[str]]) -> None:
+    replace_file(os.path.join(output, GENERATED_FIELDS_FILENAME), json.dumps(hashes, sort_keys=True).encode("utf-8"))
+
+
+def find_hand_edits(root: str, specs: list[PageSpec], baseline: dict[str, list[str]]) -> dict[str, PageFields]:
+    """Three-way merge of every article a contributor edited since it was last generated.
+
+    A field counts as edited when its on-disk value no longer matches the
+    hash ``baseline`` recorded for the generated value. Edited fields keep
+    the on-disk value and all others take the new generated value, so
+    generator changes still reach edited pages; when both sides changed a
+    field, the hand edit wins. Both sides go through the same parser, so
+    re-wrapping and the article-vs-transclusion layout are not edits.
+    Articles without a baseline entry are treated as unedited.
+    """
+    on_disk = ingest_pages(root)
+    edits = {}
+    for spec in specs:
+        fields, recorded = on_disk.get(spec.path), baseline.get(spec.path)
+        if spec.kind not in ARTICLE_KINDS or fields is None or recorded is None:
+            continue
+        edited = [name for name, current, base in zip(MERGED_FIELDS, field_hashes(fields), recorded) if current != base]
+        if edited:
+            generated = parse_page(render_page(spec))
+            edits[spec.path] = generated._replace(**{name: getattr(fields, name) for name in edited})
+    return edits
+
+
+def merge_hand_edit(spec: PageSpec, fields: PageFields) -> PageSpec:
+    """Regenerate an article from the fields ``find_hand_edits`` merged.
+
+    The title and primary category come from the generator, since they
+    decide where the page lives; added category tags are kept.
+    """
+    title, category, summary, see_also = spec.args[:4]
+    extra_categories = tuple(tag for tag in dict.fromkeys(fields.categories) if tag not in (category, "2bZ Wiki"))
+    return spec._replace(args=(
+        title,
+        category,
+        fields.overview or summary,
+        fields.see_also if fields.see_also is not None else see_also,
+        fields.short_description,
+        extra_categories,
+    ))
+
+
+def find_path_collisions(specs: list[PageSpec]) -> dict[str, list[str]]:
+    """Group titles that would be written to the same file.
+
+    Paths are compared case-insensitively because the tree is also checked out
+    on case-insensitive filesystems, where ``Foo`` and ``foo`` overwrite each other.
+    """
+    by_path = {}
+    for spec in specs:
+        by_path.setdefault(os.path.normcase(spec.path).casefold(), (spec.path, []))[1].append(spec.title)
+    return {path: titles for path, titles in by_path.values() if len(titles) > 1}
+
+
+PAGE_BUILDERS = {
+    "article": build_article_content,
+    "article_transclusion": build_article_transclusion,
+    "category": build_category_content,
+    "category_index": build_category_index,
+    "category_part": build_category_part,
+    "general": build_general_page,
+    "root_category": build_root_category,
+    "static": str,
 }
 
-CATEGORY_PAGE_DATA = {}
-for cat_name, data in categories.items():
-    article_titles = []
-    for topic in data["topics"]:
-        title = f"{cat_name[:-1] if cat_name.endswith('s') else cat_name}: {topic}" if cat_name in {"Farms & Automation", "Server Policies"} else f"{cat_name[:-1] if cat_name.endswith('s') else cat_name} Guide: {topic}"
-        # Custom naming for certain categories to avoid awkward titles
-        if cat_name == "Building Styles":
-            title = f"Building Style: {topic}"
-        elif cat_name == "Infrastructure Projects":
-            title = f"Infrastructure Project: {topic}"
-        elif cat_name == "Farms & Automation":
-            title = f"Farm Build: {topic}"
-        elif cat_name == "Redstone Mechanics":
-            title = f"Redstone Mechanic: {topic}"
-        elif cat_name == "Exploration Logs":
-            title = f"Exploration Log: {topic}"
-        elif cat_name == "Nether Expeditions":
-            title = f"Nether Expedition: {topic}"
-        elif cat_name == "End Dimension Strategies":
-            title = f"End Strategy: {topic}"
-        elif cat_name == "Economy Systems":
-            title = f"Economy System: {topic}"
-        elif cat_name == "Trading Outposts":
-            title = f"Trading Outpost: {topic}"
-        elif cat_name == "Factions & Diplomacy":
-            title = f"Faction Dossier: {topic}"
-        elif cat_name == "Community Events":
-            title = f"Community Event: {topic}"
-        elif cat_name == "History & Lore":
-            title = f"History & Lore: {topic}"
-        elif cat_name == "Landmarks & Regions":
-            title = f"Landmark Profile: {topic}"
-        elif cat_name == "Player Settlements":
-            title = f"Settlement Profile: {topic}"
-        elif cat_name == "Transportation Network":
-            title = f"Transportation Route: {topic}"
-        elif cat_name == "Technical Reference":
-            title = f"Technical Brief: {topic}"
-        elif cat_name == "Quality of Life Tools":
-            title = f"QoL Tool: {topic}"
-        elif cat_name == "Server Policies":
-            title = f"Policy Guide: {topic}"
-        elif cat_name == "Staff & Governance":
-            title = f"Governance Record: {topic}"
-        elif cat_name == "Newcomer Guides":
-            title = f"Newcomer Guide: {topic}"
-        elif cat_name == "Quick Start Tutorials":
-            title = f"Quick Start: {topic}"
-        elif cat_name == "Survival Handbook":
-            title = f"Survival Handbook: {topic}"
-        elif cat_name == "Combat Academy":
-            title = f"Combat Academy: {topic}"
-        elif cat_name == "Resource Gathering":
-            title = f"Resource Guide: {topic}"
-        CATEGORY_PAGE_DATA.setdefault(cat_name, []).append({"title": title, "topic": topic})
-
-# Build article pages
-articles_root = os.path.join(ROOT, "articles")
-SUMMARY_TEMPLATES = {
-    "Newcomer Guides": "{title} walks new survivors through the {topic_lower} aspect of spawn life so they can acclimate quickly and avoid early setbacks.",
-    "Quick Start Tutorials": "{title} condenses the essentials of {topic_lower} into a rapid-fire checklist that gets players expedition-ready in under an hour.",
-    "Survival Handbook": "{title} documents proven survival patterns for managing {topic_lower} during long sessions on play.2bz.org.",
-    "Combat Academy": "{title} breaks down {topic_lower} with drills, recommended gear, and teamwork cues for contested fights.",
-    "Resource Gathering": "{title} maps out optimal loops for sourcing {topic_lower} while minimizing risk and travel time.",
-    "Building Styles": "{title} highlights signature design motifs, block palettes, and layout tips for the {topic_lower} aesthetic.",
-    "Infrastructure Projects": "{title} serves as the operations brief for constructing and maintaining the {topic_lower} initiative.",
-    "Farms & Automation": "{title} outlines reliable redstone layouts and harvest cycles for a sustainable {topic_lower} setup.",
-    "Redstone Mechanics": "{title} catalogs wiring theory and component usage for {topic_lower} builds used across 2bZ.",
-    "Exploration Logs": "{title} compiles field notes, coordinates, and hazards encountered while surveying the {topic_lower} region.",
-    "Nether Expeditions": "{title} shares navigation strategies and combat prep specific to {topic_lower} missions in the Nether.",
-    "End Dimension Strategies": "{title} prepares crews for {topic_lower} objectives in the End, covering transport, safety, and loot recovery.",
-    "Economy Systems": "{title} explains how {topic_lower} keeps resources circulating between independent teams.",
-    "Trading Outposts": "{title} documents services, security measures, and approach routes for the {topic_lower} exchange.",
-    "Factions & Diplomacy": "{title} summarizes history, membership expectations, and diplomatic ties surrounding the {topic_lower} group.",
-    "Community Events": "{title} captures format, signup steps, and highlight reels from the {topic_lower} celebration.",
-    "History & Lore": "{title} records testimonies, archival screenshots, and major outcomes tied to the {topic_lower} era.",
-    "Landmarks & Regions": "{title} profiles terrain features, builders, and logistics that make the {topic_lower} landmark notable.",
-    "Player Settlements": "{title} lists resident guidelines, visitor etiquette, and amenities maintained at the {topic_lower} settlement.",
-    "Transportation Network": "{title} explains maintenance plans, travel advisories, and integration points for the {topic_lower} route.",
-    "Technical Reference": "{title} provides measurements, experiments, and recommended practices for {topic_lower} considerations.",
-    "Quality of Life Tools": "{title} reviews approved configurations and onboarding instructions for the {topic_lower} enhancement.",
-    "Server Policies": "{title} clarifies enforcement scope, rationale, and reporting expectations for {topic_lower}.",
-    "Staff & Governance": "{title} details responsibilities, documentation workflows, and accountability steps for {topic_lower} duties.",
+
+def render_page(spec: PageSpec) -> str:
+    return PAGE_BUILDERS[spec.kind](*spec.args)
+
+
+# Modules whose code or data decide what a page renders to; editing any of them
+# invalidates the persistent render cache.
+GENERATOR_SOURCES = ("build_pages.py", "page_model.py", "wiki_data.py", "wikiwrap.py")
+
+
+@lru_cache(maxsize=None)
+def generator_version() -> str:
+    digest = hashlib.sha256()
+    for name in GENERATOR_SOURCES:
+        with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), name), "rb") as handle:
+            digest.update(handle.read())
+    return digest.hexdigest()
+
+
+def render_page_bytes(spec: PageSpec, cache: RenderCache | None = None) -> bytes:
+    """Render ``spec`` to file contents, through ``cache`` when given."""
+    if cache is None:
+        return page_bytes(render_page(spec))
+    key = cache.key(generator_version(), spec.kind, repr(spec.args))
+    data = cache.get(key)
+    if data is None:
+        data = page_bytes(render_page(spec))
+        cache.put(key, data)
+    return data
+
+
+PAGE_DOCUMENTS = {
+    "article": article_document,
+    "category": category_document,
+    "category_index": category_index_document,
+    "category_part": category_part_document,
+    "general": general_document,
+    "root_category": root_category_document,
 }
+# Pages stored as something other than what they display: a transclusion
+# is a template call, but readers see the article it expands to.
+DISPLAY_DOCUMENTS = {
+    "article_transclusion": article_document,
+}
+
+
+def page_document(spec: PageSpec) -> list:
+    """Return the blocks a reader sees on the page, e.g. for Markdown output."""
+    builder = PAGE_DOCUMENTS.get(spec.kind) or DISPLAY_DOCUMENTS.get(spec.kind)
+    if builder is None:
+        # Templates only exist as wikitext.
+        return [Raw(render_page(spec))]
+    return builder(*spec.args)
+
+
+# Checkpoints
+
+CHECKPOINT_FILENAME = ".build-checkpoint.json"
+CHECKPOINT_OPTIONS = ("transclude", "category_page_size", "markdown", "compress", "compress_only", "zstd_dictionary")
+
+
+def input_fingerprint(specs: list[PageSpec], options: dict) -> str:
+    """Hash everything that determines the output: generator code, options and page inputs."""
+    digest = hashlib.sha256(generator_version().encode("utf-8"))
+    digest.update(repr(sorted(options.items())).encode("utf-8"))
+    for spec in specs:
+        digest.update(repr(spec).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def load_checkpoint(output: str) -> dict | None:
+    try:
+        with open(os.path.join(output, CHECKPOINT_FILENAME), encoding="utf-8") as handle:
+            return json.load(handle)
+    except FileNotFoundError:
+        return None
+
+
+def save_checkpoint(output: str, fingerprint: str, completed: int) -> None:
+    """Record that the first ``completed`` planned pages are on disk.
+
+    The plan order is deterministic for a given fingerprint, so a count is
+    enough to identify the finished pages.
+    """
+    checkpoint = {"input_hash": fingerprint, "completed": completed}
+    replace_file(os.path.join(output, CHECKPOINT_FILENAME), json.dumps(checkpoint).encode("utf-8"))
+
+
+def clear_checkpoint(output: str) -> None:
+    try:
+        os.remove(os.path.join(output, CHECKPOINT_FILENAME))
+    except FileNotFoundError:
+        pass
+
+
+# Command line
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Generate the 2bZ wiki pages as MediaWiki source files.")
+    parser.add_argument("--output", default=ROOT, help="directory to write pages into (default: the repository's pages/ tree)")
+    parser.add_argument("--synthetic", type=int, metavar="N", help="replace every category's topics with N seeded synthetic topics for benchmarking")
+    parser.add_argument("--seed", type=int, default=0, help="seed for --synthetic topic names (default: 0)")
+    parser.add_argument("--list-titles", action="store_true", help="print the title of every planned page and exit")
+    parser.add_argument("--page", metavar="TITLE", help="print the wikitext of the page titled TITLE and exit")
+    parser.add_argument("--verify", action="store_true", help="check that the output tree matches what would be generated, without writing; exits 1 on differences")
+    parser.add_argument("--resume", action="store_true", help="continue an interrupted build from its last checkpoint if the inputs are unchanged")
+    parser.add_argument("--checkpoint-every", type=int, default=1000, metavar="N", help="record build progress every N pages (default: 1000)")
+    parser.add_argument("--no-fsync", dest="fsync", action="store_false", help="skip the per-batch sync; pages are still replaced atomically but may be lost on power failure")
+    parser.add_argument("--swap-tree", action="store_true", help="build into a staging directory next to the output and publish the whole tree with one swap")
+    parser.add_argument("--git-commit", metavar="BRANCH", help="commit the pages to BRANCH with git fast-import instead of writing the working tree")
+    parser.add_argument("--git-message", default="Regenerate wiki pages", help="commit message for --git-commit")
+    parser.add_argument("--keep-edits", action="store_true", help="carry hand edits to article Short descriptions, Overviews, See Also links and category tags in the output tree into the regenerated pages")
+    parser.add_argument("--transclude", action="store_true", help="emit articles as short {{2bZ Article}} calls and write the shared template")
+    parser.add_argument("--see-also", choices=("sequential", "similar"), default="sequential", help="pick See Also links from the next titles in the category (default) or by text similarity across all categories (needs numpy)")
+    parser.add_argument("--near-duplicates", choices=("report", "drop"), help="find topics whose pages would be near-identical (MinHash/LSH over topics and summaries, needs numpy); list them, or also keep only the first of each group")
+    parser.add_argument("--near-duplicate-threshold", type=float, default=0.8, metavar="J", help="estimated Jaccard similarity at which --near-duplicates groups two topics (default: 0.8)")
+    parser.add_argument("--category-page-size", type=int, metavar="N", help="split categories with more than N pages into an index and alphabetical sub-pages of about N entries")
+    parser.add_argument("--render-cache", metavar="DIR", help="reuse rendered pages across runs from a content-addressed cache in DIR (safe to share between concurrent builds)")
+    parser.add_argument("--render-cache-size", default="512M", metavar="SIZE", help="evict least recently used --render-cache entries beyond SIZE (default: 512M)")
+    parser.add_argument("--html", metavar="DIR", help="also render a static HTML mirror of the pages into DIR")
+    parser.add_argument("--html-cache", metavar="DIR", help="reuse HTML for pages whose source and links are unchanged, cached in DIR")
+    parser.add_argument("--markdown", metavar="DIR", help="also write a Markdown version of every page into DIR, rendered in the same pass as the wikitext")
+    parser.add_argument("--sitemap", metavar="DIR", help="write sitemap.xml and sitemap-N.xml parts for the HTML mirror into DIR while the pages are written (needs --base-url)")
+    parser.add_argument("--base-url", metavar="URL", help="URL the HTML mirror and --sitemap DIR are published at")
+    parser.add_argument("--page-index", metavar="PATH", help="write a JSON Lines listing of every page (title, path, category, content SHA-256) to PATH while the pages are written")
+    parser.add_argument("--link-report", action="store_true", help="print link-graph analytics (orphans, reachability from Main Page, PageRank) for the generated pages (needs numpy)")
+    parser.add_argument("--compress", choices=sorted(COMPRESSED_SUFFIXES), help="also write a precompressed .gz or .zst sibling for every page")
+    parser.add_argument("--compress-only", action="store_true", help="write only the compressed variants, not the plain .mediawiki files")
+    parser.add_argument("--compress-workers", type=int, metavar="N", help="compression worker threads (default: based on CPU count)")
+    parser.add_argument("--zstd-dictionary", action="store_true", help=f"train a shared dictionary on the rendered boilerplate and save it as {DICTIONARY_FILENAME}; readers need it to decompress")
+    parser.add_argument("--metrics-file", metavar="PATH", help="write build counters and latency histograms to PATH in OpenMetrics text format, e.g. for a node_exporter textfile collector")
+    parser.add_argument("--memory-report", action="store_true", help="trace Python allocations per build stage with tracemalloc and print them with peak RSS and the top allocation sites (slows the build)")
+    parser.add_argument("--max-memory", metavar="SIZE", help="stop the build with a per-stage breakdown once peak RSS exceeds SIZE (e.g. 2G, 512M)")
+    args = parser.parse_args(argv)
+    if args.checkpoint_every < 1:
+        parser.error("--checkpoint-every must be at least 1")
+    if args.category_page_size is not None and args.category_page_size < 1:
+        parser.error("--category-page-size must be at least 1")
+    if args.compress_only and not args.compress:
+        parser.error("--compress-only needs --compress")
+    if args.zstd_dictionary and args.compress != "zst":
+        parser.error("--zstd-dictionary needs --compress zst")
+    if args.git_commit and (args.resume or args.swap_tree or args.compress):
+        parser.error("--git-commit cannot be combined with --resume, --swap-tree or --compress")
+    if not 0 < args.near_duplicate_threshold <= 1:
+        parser.error("--near-duplicate-threshold must be in (0, 1]")
+    if bool(args.sitemap) != bool(args.base_url):
+        parser.error("--sitemap and --base-url must be given together")
+    if args.html_cache and not args.html:
+        parser.error("--html-cache needs --html")
+    for option in ("max_memory", "render_cache_size"):
+        value = getattr(args, option)
+        if value is not None:
+            try:
+                setattr(args, option, parse_size(value))
+            except ValueError:
+                parser.error(f"--{option.replace('_', '-')}: invalid size {value!r} (use bytes or a K, M or G suffix)")
+    if args.synthetic is not None:
+        if args.synthetic < 1:
+            parser.error("--synthetic must be at least 1")
+        if os.path.abspath(args.output) == os.path.abspath(ROOT):
+            parser.error("--synthetic needs an explicit --output so the committed pages/ tree is left alone")
+    return args
+
+
+def main(argv: list[str] | None = None) -> None:
+    args = parse_args(argv)
+    metrics = BuildMetrics()
+    memory = MemoryTracker(trace=args.memory_report, budget=args.max_memory)
+    source, page_data = categories, CATEGORY_PAGE_DATA
+    if args.synthetic is not None:
+        with memory.stage("load"):
+            source = synthesize_categories(categories, args.synthetic, args.seed)
+        with memory.stage("page data"):
+            page_data = build_category_page_data(source)
+    if args.near_duplicates:
+        with memory.stage("near duplicates"):
+            clusters = find_near_duplicate_topics(page_data, args.near_duplicate_threshold)
+        print(f"{len(clusters)} group(s) of near-duplicate topics.")
+        for cluster in clusters[:NEAR_DUPLICATE_REPORT_LIMIT]:
+            print("  " + " | ".join(f"{title} ({cat_name})" for cat_name, title in cluster))
+        if len(clusters) > NEAR_DUPLICATE_REPORT_LIMIT:
+            print(f"  ... and {len(clusters) - NEAR_DUPLICATE_REPORT_LIMIT} more")
+        if args.near_duplicates == "drop":
+            page_data = drop_near_duplicates(page_data, clusters)
+            print(f"Dropped {sum(len(cluster) - 1 for cluster in clusters)} near-duplicate article(s).")
+
+    with memory.stage("plan"):
+        see_also_map = similarity_see_also(page_data) if args.see_also == "similar" else None
+        specs = plan_pages(
+            source,
+            page_data,
+            GENERAL_PAGES,
+            transclude=args.transclude,
+            category_page_size=args.category_page_size,
+            see_also_map=see_also_map,
+        )
+    baseline = load_generated_fields(args.output)
+    generated_specs = specs
+    if args.keep_edits:
+        if baseline is None:
+            print(f"No record of previously generated fields in {args.output}; treating every page as unedited this time.")
+        edits = find_hand_edits(args.output, specs, baseline or {})
+        specs = [merge_hand_edit(spec, edits[spec.path]) if spec.path in edits else spec for spec in specs]
+        print(f"Keeping hand edits in {len(edits)} page(s).")
+        for path in sorted(edits):
+            print(f"  {path}")
+    collisions = find_path_collisions(specs)
+    if collisions:
+        details = "\n".join(f"  {path}: {', '.join(titles)}" for path, titles in sorted(collisions.items()))
+        raise SystemExit(f"Refusing to write: {len(collisions)} output file(s) are shared by several titles:\n{details}")
+
+    if args.list_titles:
+        print("\n".join(spec.title for spec in specs))
+        return
+    if args.page is not None:
+        wanted = normalize_title(args.page)
+        spec = next((spec for spec in specs if normalize_title(spec.title) == wanted), None)
+        if spec is None:
+            raise SystemExit(f"No page titled {args.page!r}.")
+        sys.stdout.write(page_bytes(render_page(spec)).decode("utf-8"))
+        return
+
+    if args.verify:
+        with memory.stage("verify"):
+            report = verify_pages(args.output, specs)
+        if args.memory_report:
+            print(memory.report())
+        for label, paths in report.items():
+            for path in sorted(paths):
+                print(f"{label}: {path}")
+        if any(report.values()):
+            raise SystemExit(1)
+        print(f"{len(specs)} pages up to date.")
+        return
+
+    # Once a tree has a baseline, every build must refresh it, or the next
+    # --keep-edits run would take regenerated fields for hand edits.
+    generated_fields = None
+    if (args.keep_edits or baseline is not None) and not args.git_commit:
+        with memory.stage("generated fields"):
+            generated_fields = generated_field_hashes(generated_specs)
+
+    root = args.output
+    if args.swap_tree:
+        root = os.path.normpath(args.output) + ".staging"
+        if not args.resume and os.path.exists(root):
+            shutil.rmtree(root)
+    if not args.git_commit:
+        stale = remove_stale_temporaries(root)
+        if stale:
+            print(f"Removed {len(stale)} leftover temporary file(s).")
+
+    compressor = None
+    # Siblings of unchanged pages are only recompressed when the settings they were written with changed.
+    recompress = False
+    if args.compress:
+        dictionary = None
+        if args.zstd_dictionary:
+            step = max(1, len(specs) // 2000)
+            dictionary = train_zstd_dictionary([page_bytes(render_page(spec)) for spec in specs[::step]])
+            dictionary_path = os.path.join(root, DICTIONARY_FILENAME)
+            if not content_matches(dictionary_path, dictionary):
+                replace_file(dictionary_path, dictionary)
+        compressor = PageCompressor(args.compress, args.compress_workers, dictionary)
+        recompress = load_compression_settings(root) != compressor.settings
+
+    fingerprint = input_fingerprint(specs, {name: getattr(args, name) for name in CHECKPOINT_OPTIONS})
+    start = 0
+    if args.resume:
+        checkpoint = load_checkpoint(root)
+        if checkpoint is None:
+            print("No checkpoint found; building from the start.")
+        elif checkpoint["input_hash"] != fingerprint:
+            raise SystemExit("Inputs changed since the checkpoint was written; rerun without --resume.")
+        else:
+            start = checkpoint["completed"]
+            print(f"Resuming after {start} of {len(specs)} pages.")
+
+    # Kept in memory only for the stages that need the whole site at once.
+    # The HTML mirror is such a stage: html_site renders it from the wikitext
+    # afterwards, not from the document model (see page_model).
+    keep_pages = bool(args.html or args.link_report)
+    rendered_pages = []
+    render_cache = RenderCache(args.render_cache, args.render_cache_size) if args.render_cache else None
+    if args.markdown:
+        title_paths = {normalize_title(spec.title): spec.path for spec in specs}
+    if args.sitemap or args.page_index:
+        from site_index import PageIndexWriter, SitemapWriter
+
+    sitemap = SitemapWriter(args.sitemap, args.base_url) if args.sitemap else None
+    page_index = PageIndexWriter(args.page_index) if args.page_index else None
+    completed = start
+    if args.git_commit:
+        from git_fast_import import FastImportCommit
+
+        repo = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        prefix = os.path.relpath(os.path.abspath(args.output), repo)
+        if prefix.startswith(os.pardir):
+            raise SystemExit(f"--git-commit needs --output inside the repository ({repo})")
+        importer = FastImportCommit(repo, args.git_commit, prefix, args.git_message)
+    with memory.stage("render+write"):
+        writer = AtomicPageWriter(durable=args.fsync)
+        try:
+            for index, spec in enumerate(specs):
+                if index < start:
+                    if keep_pages:
+                        rendered_pages.append((spec.title, spec.path, render_page(spec)))
+                    if page_index is not None:
+                        page_index.add(spec.title, spec.path, spec.category, render_page_bytes(spec, render_cache))
+                    if sitemap is not None:
+                        sitemap.add(html_path(spec.path))
+                    continue
+                path = os.path.join(root, spec.path)
+                render_started = time.perf_counter()
+                if args.markdown:
+                    markdown_path = os.path.splitext(spec.path)[0] + ".md"
+                    markdown_renderer = MarkdownRenderer(link_resolver(title_paths, markdown_path, ".md"))
+                    if spec.kind in DISPLAY_DOCUMENTS:
+                        (markdown,) = render(page_document(spec), markdown_renderer)
+                        content = render_page(spec)
+                    else:
+                        content, markdown = render(page_document(spec), MediaWikiRenderer(), markdown_renderer)
+                    writer.write(os.path.join(args.markdown, markdown_path), markdown.encode("utf-8"))
+                    data = page_bytes(content)
+                else:
+                    data = render_page_bytes(spec, render_cache)
+                    if keep_pages:
+                        content = data.decode("utf-8")
+                write_started = time.perf_counter()
+                if keep_pages:
+                    rendered_pages.append((spec.title, spec.path, content))
+                if page_index is not None:
+                    page_index.add(spec.title, spec.path, spec.category, data)
+                if sitemap is not None:
+                    sitemap.add(html_path(spec.path))
+                # With --compress-only the compressor reports what it replaced once it is done.
+                changed = None
+                if args.git_commit:
+                    changed = importer.add(spec.path, data)
+                elif not args.compress_only:
+                    changed = writer.write(path, data)
+                if compressor is not None and (changed is not False or recompress or not os.path.exists(path + compressor.suffix)):
+                    ensure_dir(os.path.dirname(path))
+                    compressor.submit(path, data)
+                metrics.record_page(spec.category, write_started - render_started, time.perf_counter() - write_started, len(data), changed)
+                completed = index + 1
+                if completed % 64 == 0:
+                    memory.check()
+                if completed % args.checkpoint_every == 0 and not args.git_commit:
+                    writer.commit()
+                    if compressor is not None:
+                        compressor.flush()
+                    save_checkpoint(root, fingerprint, completed)
+            writer.commit()
+        except BaseException:
+            writer.commit()
+            for index_writer in (sitemap, page_index):
+                if index_writer is not None:
+                    index_writer.abort()
+            if args.git_commit:
+                importer.abort()
+                raise
+            # Compressed variants may still be in flight; the last periodic
+            # checkpoint is the newest state known to be complete.
+            if compressor is None and completed > start:
+                save_checkpoint(root, fingerprint, completed)
+            raise
+        finally:
+            if compressor is not None:
+                compressor.close()
+    if args.compress_only:
+        metrics.record_writes(compressor.written, compressor.unchanged, compressor.written_bytes)
+    clear_checkpoint(root)
+    if not args.git_commit:
+        suffixes = ("", COMPRESSED_SUFFIXES[args.compress]) if args.compress else ("",)
+        stale = remove_stale_category_parts(root, specs, suffixes)
+        if stale:
+            print(f"Removed {len(stale)} stale category index page(s).")
+        # Without --compress the siblings are not kept in step with the pages, so the next compressed build redoes them all.
+        save_compression_settings(root, compressor.settings if compressor is not None else None)
+        if compressor is not None and compressor.dictionary_hash is None:
+            try:
+                os.remove(os.path.join(root, DICTIONARY_FILENAME))
+            except FileNotFoundError:
+                pass
+    if generated_fields is not None:
+        save_generated_fields(root, generated_fields)
+    if sitemap is not None:
+        sitemap.finish()
+        print(f"Wrote {len(sitemap.parts)} sitemap file(s) for {sitemap.urls} pages to {args.sitemap}.")
+    if page_index is not None:
+        page_index.finish()
+        print(f"Indexed {page_index.pages} pages in {args.page_index}.")
+    if render_cache is not None:
+        evicted = render_cache.prune()
+        metrics.record_render_cache(render_cache.hits, render_cache.misses, evicted)
+        print(f"Render cache: {render_cache.hits} hits, {render_cache.misses} misses, {evicted} evicted.")
+
+    if args.git_commit:
+        commit = importer.finish()
+        if commit is None:
+            print(f"No page changes; {args.git_commit} left as is.")
+        else:
+            print(f"Committed pages to {args.git_commit} as {commit[:12]} ({importer.sent} new blobs, {importer.reused} reused).")
+            if importer.checked_out:
+                print(f"{args.git_commit} is checked out; run 'git reset --hard' or 'git checkout -- {prefix}' to update the working tree.")
+
+    if args.html:
+        with memory.stage("html"):
+            stats = render_site(rendered_pages, args.html, cache_dir=args.html_cache)
+        print(f"Rendered {stats['pages']} HTML pages ({stats['cache_hits']} from cache).")
+
+    if args.link_report:
+        from link_graph import link_report
+
+        with memory.stage("link report"):
+            report = link_report([(title, content) for title, _, content in rendered_pages])
+        print(report)
+
+    if args.swap_tree:
+        swap_tree(root, args.output)
+
+    if args.memory_report:
+        print(memory.report())
+    if args.metrics_file:
+        metrics.write(args.metrics_file)
+    print("Pages generated.")
+
 
-for cat_name, entries in CATEGORY_PAGE_DATA.items():
-    cat_slug = sanitize_filename(cat_name.lower().replace(" & ", " and ").replace(" ", "-"))
-    category_dir = os.path.join(articles_root, cat_slug)
-    ensure_dir(category_dir)
-    titles = [entry["title"] for entry in entries]
-    for idx, entry in enumerate(entries):
-        title = entry["title"]
-        topic = entry["topic"]
-        filename = sanitize_filename(title) + ".mediawiki"
-        path = os.path.join(category_dir, filename)
-        topic_lower = topic.lower()
-        summary_template = SUMMARY_TEMPLATES.get(cat_name, "{title} captures collective knowledge about {topic_lower} for long-term archival.")
-        summary = textwrap.dedent(
-            summary_template.format(
-                title=title,
-                topic=topic,
-                topic_lower=topic_lower,
-                category=cat_name,
-            )
-        ).strip() + " This entry links back to [[Category:{category}|{category}]] for additional context.".format(category=cat_name)
-        see_also = []
-        for offset in (1, 2, 3):
-            see_title = titles[(idx + offset) % len(titles)]
-            if see_title != title:
-                see_also.append(see_title)
-        content = build_article_content(title, cat_name, summary, see_also[:3])
-        write_page(path, content)
-
-# Build category pages
-category_root = os.path.join(ROOT, "categories")
-ensure_dir(category_root)
-for cat_name, data in categories.items():
-    filename = sanitize_filename(cat_name) + ".mediawiki"
-    description = data["description"]
-    pages = [entry["title"] for entry in CATEGORY_PAGE_DATA[cat_name]]
-    content = build_category_content(cat_name, description, pages)
-    write_page(os.path.join(category_root, filename), content)
-
-# Build general pages
-general_root = os.path.join(ROOT, "general")
-ensure_dir(general_root)
-for title, data in GENERAL_PAGES.items():
-    filename = sanitize_filename(title) + ".mediawiki"
-    content = build_general_page(title, data["summary"], data["sections"])
-    write_page(os.path.join(general_root, filename), content)
-
-# Category:2bZ Wiki page
-category_2bz_path = os.path.join(category_root, "2bZ_Wiki.mediawiki")
-category_2bz_content = """
-{{Short description|Umbrella category for all documentation on the 2bZ community wiki}}
-= Category:2bZ Wiki =
-{{2bZ Navbox}}
-__NOTOC__
-
-All published guides, histories, and technical briefs on this wiki include the [[Category:2bZ Wiki]] tag so that contributors can audit coverage quickly. Use the category links below to jump directly into a focus area.
-
-== Primary Categories ==
-* [[Category:Newcomer Guides]]
-* [[Category:Quick Start Tutorials]]
-* [[Category:Survival Handbook]]
-* [[Category:Combat Academy]]
-* [[Category:Resource Gathering]]
-* [[Category:Building Styles]]
-* [[Category:Infrastructure Projects]]
-* [[Category:Farms & Automation]]
-* [[Category:Redstone Mechanics]]
-* [[Category:Exploration Logs]]
-* [[Category:Nether Expeditions]]
-* [[Category:End Dimension Strategies]]
-* [[Category:Economy Systems]]
-* [[Category:Trading Outposts]]
-* [[Category:Factions & Diplomacy]]
-* [[Category:Community Events]]
-* [[Category:History & Lore]]
-* [[Category:Landmarks & Regions]]
-* [[Category:Player Settlements]]
-* [[Category:Transportation Network]]
-* [[Category:Technical Reference]]
-* [[Category:Quality of Life Tools]]
-* [[Category:Server Policies]]
-* [[Category:Staff & Governance]]
-
-[[Category:2bZ Wiki]]
-""".strip()
-write_page(category_2bz_path, category_2bz_content)
-
-# Template page
-template_root = os.path.join(ROOT, "templates")
-ensure_dir(template_root)
-template_content = """
-<includeonly>{| class="wikitable" style="width:100%; background:#0b0d17; color:#f4f4f4; border:2px solid #3a6ea5;"
-! colspan="3" style="text-align:center; font-size:1.4em; background:#1b2333;" | 2bZ Wiki Navigation
-|-
-| style="width:33%; vertical-align:top;" |
-; Orientation
-:[[Main Page]]
-:[[Quick Access Portal]]
-:[[Player Support Hub]]
-:[[Safety & Security Center]]
-| style="width:33%; vertical-align:top;" |
-; Build & Explore
-:[[Build Inspiration Gallery]]
-:[[Infrastructure Control Center]]
-:[[Exploration Gateway]]
-:[[Transport Planner Hub]]
-| style="width:33%; vertical-align:top;" |
-; Reference
-:[[Technical Reference Index]]
-:[[Resource Planning Dashboard]]
-:[[Community Governance Overview]]
-:[[Update & Patch Archive]]
-|-
-| colspan="3" style="text-align:center; background:#1b2333;" | Categories: [[Category:Newcomer Guides]] · [[Category:Resource Gathering]] · [[Category:Community Events]] · [[Category:Technical Reference]]
-|}</includeonly><noinclude>
-{{Documentation|content=Navigation template linking the primary hubs of the 2bZ community wiki.}}
-</noinclude>
-""".strip()
-write_page(os.path.join(template_root, "Template_2bZ_Navbox.mediawiki"), template_content)
-
-print("Pages generated.")
+if __name__ == "__main__":
+    main()
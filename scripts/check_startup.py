@@ -0,0 +1,96 @@
+"""Check that quick generator invocations stay within a startup budget.
+
+Pre-commit hooks run ``build_pages.py`` for ``--help``, ``--list-titles``
+and single ``--page`` renders, so those must not pay for the full build's
+imports. Each command runs several times under ``python -X importtime``;
+the fastest run is compared with the budget, and its slowest top-level
+imports are listed. The check also fails when a module that the build only
+loads on demand (worker pools, ctypes, optional dependencies) shows up.
+
+Usage: ``python scripts/check_startup.py [--budget-ms 50] [--runs 5] [--top 8]``
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "build_pages.py")
+COMMANDS = {
+    "help": ["--help"],
+    "list titles": ["--list-titles"],
+    "one page": ["--page", "Main Page"],
+}
+# Loaded only by the options that need them; importing one at startup is a regression.
+DEFERRED_MODULES = (
+    "concurrent.futures",
+    "ctypes",
+    "multiprocessing",
+    "numpy",
+    "site_index",
+    "urllib.request",
+    "zstandard",
+)
+
+
+def parse_importtime(stderr: str) -> list[tuple[str, int, int]]:
+    """Return ``(module, self_us, cumulative_us)`` for every import in ``-X importtime`` output.
+
+    Module names keep their leading spaces, two per level of nesting.
+    """
+    imports = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        if self_us.strip().isdigit():
+            # Keep the indentation of the name: nested imports are indented under their parent.
+            imports.append((name[1:].rstrip(), int(self_us), int(cumulative_us)))
+    return imports
+
+
+def run(arguments: list[str]) -> tuple[float, list[tuple[str, int, int]]]:
+    started = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", SCRIPT, *arguments],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    elapsed = time.perf_counter() - started
+    if result.returncode != 0:
+        raise SystemExit(f"build_pages.py {' '.join(arguments)} failed:\n{result.stderr}")
+    return elapsed, parse_importtime(result.stderr)
+
+
+def main(argv: list[str]) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--budget-ms", type=float, default=50.0, help="wall-time budget per command, in milliseconds (default: 50)")
+    parser.add_argument("--runs", type=int, default=5, help="runs per command; the fastest counts (default: 5)")
+    parser.add_argument("--top", type=int, default=8, help="slowest top-level imports to list (default: 8)")
+    args = parser.parse_args(argv)
+
+    if sys.flags.dont_write_bytecode:
+        print("Bytecode caching is off (PYTHONDONTWRITEBYTECODE); timings include compiling every module.")
+    failures = []
+    for label, arguments in COMMANDS.items():
+        elapsed, imports = min((run(arguments) for _ in range(args.runs)), key=lambda result: result[0])
+        status = "ok" if elapsed * 1000 <= args.budget_ms else "OVER BUDGET"
+        print(f"{label}: {elapsed * 1000:.1f} ms ({status})")
+        top_level = sorted((item for item in imports if not item[0].startswith(" ")), key=lambda item: -item[2])
+        for name, _, cumulative_us in top_level[:args.top]:
+            print(f"  {cumulative_us / 1000:6.1f} ms  {name}")
+        if status != "ok":
+            failures.append(f"{label} took {elapsed * 1000:.1f} ms, budget {args.budget_ms:g} ms")
+        loaded = {name.strip() for name, _, _ in imports}
+        for module in DEFERRED_MODULES:
+            if module in loaded:
+                failures.append(f"{label} imports {module}, which should only load on demand")
+    if failures:
+        raise SystemExit("Startup budget exceeded:\n" + "\n".join(f"  {failure}" for failure in failures))
+    print("Startup within budget.")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
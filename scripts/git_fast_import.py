@@ -0,0 +1,109 @@
+"""Commit rendered pages straight into git with ``git fast-import``.
+
+Pages are hashed as git blobs in memory; any blob already present in the
+branch's previous tree is referenced by its id instead of being sent again,
+so only changed pages cross the pipe. The commit replaces the whole page
+directory, which also drops pages that are no longer generated; a branch
+that does not exist yet forks from ``HEAD``. Nothing is written to the
+working tree.
+"""
+
+import hashlib
+import os
+import subprocess
+import time
+
+
+def blob_id(data: bytes) -> str:
+    return hashlib.sha1(b"blob %d\x00" % len(data) + data).hexdigest()
+
+
+def git(repo: str, *args: str, check: bool = True) -> str:
+    result = subprocess.run(["git", *args], cwd=repo, capture_output=True, check=check)
+    return result.stdout.decode("utf-8", "surrogateescape")
+
+
+def tree_blobs(repo: str, ref: str, prefix: str) -> dict[str, str]:
+    """Map each file path under ``prefix`` in ``ref`` to its blob id."""
+    listing = git(repo, "ls-tree", "-r", "-z", "--full-tree", ref, "--", prefix, check=False)
+    blobs = {}
+    for record in filter(None, listing.split("\x00")):
+        meta, path = record.split("\t", 1)
+        _, kind, object_id = meta.split()
+        if kind == "blob":
+            blobs[path] = object_id
+    return blobs
+
+
+class FastImportCommit:
+    """Stream pages into one commit on ``branch`` replacing everything under ``prefix``."""
+
+    def __init__(self, repo: str, branch: str, prefix: str, message: str):
+        self.repo = repo
+        self.ref = f"refs/heads/{branch}"
+        self.prefix = prefix.strip("/")
+        self.message = message
+        self.parent = git(repo, "rev-parse", "--verify", "--quiet", f"{self.ref}^{{commit}}", check=False).strip() or None
+        # A new branch forks from the checked-out commit.
+        self.new_branch = self.parent is None
+        if self.new_branch:
+            self.parent = git(repo, "rev-parse", "--verify", "--quiet", "HEAD^{commit}", check=False).strip() or None
+        self.previous = tree_blobs(repo, self.parent, self.prefix) if self.parent else {}
+        self.known = {object_id: object_id for object_id in self.previous.values()}
+        self.changed = False
+        self.checked_out = git(repo, "symbolic-ref", "--quiet", "HEAD", check=False).strip() == self.ref
+        self.entries: list[tuple[str, str]] = []
+        self.sent = 0
+        self.reused = 0
+        self._process = subprocess.Popen(["git", "fast-import", "--quiet"], cwd=repo, stdin=subprocess.PIPE)
+        self._stream = self._process.stdin
+
+    def add(self, relative_path: str, data: bytes) -> bool:
+        """Add a page to the commit; returns False when the branch already has this content."""
+        path = relative_path.replace(os.sep, "/")
+        if self.prefix:
+            path = f"{self.prefix}/{path}"
+        object_id = blob_id(data)
+        changed = self.previous.get(path) != object_id
+        self.changed = self.changed or changed
+        dataref = self.known.get(object_id)
+        if dataref is not None:
+            self.reused += 1
+            self.entries.append((path, dataref))
+            return changed
+        self.sent += 1
+        dataref = self.known[object_id] = f":{self.sent}"
+        self._stream.write(b"blob\nmark %s\ndata %d\n" % (dataref.encode(), len(data)) + data + b"\n")
+        self.entries.append((path, dataref))
+        return changed
+
+    def finish(self) -> str | None:
+        """Write the commit; returns the new commit id, or None when nothing changed."""
+        unchanged = self.parent is not None and not self.changed and len(self.entries) == len(self.previous)
+        try:
+            if not unchanged:
+                ident = git(self.repo, "var", "GIT_COMMITTER_IDENT", check=False).strip() or f"2bZ wiki generator <wiki@2bz.org> {int(time.time())} +0000"
+                message = self.message.encode("utf-8")
+                header = [f"commit {self.ref}", f"committer {ident}", f"data {len(message)}"]
+                self._stream.write("\n".join(header).encode("utf-8") + b"\n" + message + b"\n")
+                if self.parent:
+                    self._stream.write(f"from {self.parent}\n".encode())
+                lines = [f"D {self.prefix}"] if self.prefix else ["deleteall"]
+                lines += [f"M 100644 {object_id} {path}" for path, object_id in self.entries]
+                self._stream.write(("\n".join(lines) + "\n\n").encode("utf-8"))
+            elif self.new_branch:
+                self._stream.write(f"reset {self.ref}\nfrom {self.parent}\n\n".encode())
+            self._stream.write(b"done\n")
+        finally:
+            self._stream.close()
+            status = self._process.wait()
+        if status:
+            raise SystemExit(f"git fast-import failed with exit status {status}")
+        if unchanged and not self.new_branch:
+            return None
+        return git(self.repo, "rev-parse", self.ref).strip()
+
+    def abort(self) -> None:
+        self._stream.close()
+        self._process.kill()
+        self._process.wait()
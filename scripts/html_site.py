@@ -0,0 +1,395 @@
+"""Render generated wikitext into a static HTML mirror.
+
+Only the subset of wikitext the generator emits is supported: headings,
+``*``/``#``/``;``/``:`` lists, paragraphs, bold and italic quotes,
+``[[...]]`` links, category tags, the ``{| ... |}`` table used by the navbox
+and template calls to pages in the ``Template:`` namespace. Templates are
+expanded from the generated template pages; parameterless ones such as
+``{{2bZ Navbox}}`` are rendered to HTML once per worker and reused.
+
+Usage: ``python scripts/html_site.py [PAGES_DIR] OUTPUT_DIR``
+"""
+
+import hashlib
+import html
+import os
+import re
+import sys
+from functools import lru_cache
+from typing import Iterable
+
+from page_reader import content_matches
+from page_writer import replace_file
+
+RENDERER_VERSION = "1"
+STYLESHEET = """body { font-family: sans-serif; max-width: 60em; margin: 0 auto; padding: 1em; line-height: 1.5; }
+a.new { color: #ba0000; }
+table { border-collapse: collapse; }
+.catlinks { border-top: 1px solid #aaa; margin-top: 2em; padding-top: .5em; font-size: .9em; }
+"""
+
+LINK_RE = re.compile(r"\[\[([^\[\]|]+)(?:\|([^\[\]]*))?\]\]")
+TEMPLATE_CALL_RE = re.compile(r"\{\{(?!\{)([^{}]*)\}\}")
+PARAMETER_RE = re.compile(r"\{\{\{([^{}|]+)(?:\|([^{}]*))?\}\}\}")
+PIPE_OUTSIDE_LINKS_RE = re.compile(r"\|(?![^\[]*\]\])")
+HEADING_RE = re.compile(r"^(={1,6})\s*(.+?)\s*\1\s*$")
+BOLD_RE = re.compile(r"'''(.+?)'''")
+ITALIC_RE = re.compile(r"''(.+?)''")
+ATTRIBUTE_RE = re.compile(r'\s*([A-Za-z-]+)\s*=\s*"([^"]*)"')
+INCLUDEONLY_RE = re.compile(r"<includeonly>(.*?)</includeonly>", re.S)
+NOINCLUDE_RE = re.compile(r"<noinclude>.*?</noinclude>", re.S)
+LIST_TAGS = {"*": ("ul", "li"), "#": ("ol", "li"), ";": ("dl", "dt"), ":": ("dl", "dd")}
+BLOCK_MARKER = "\x00block:{}\x00"
+
+
+def normalize_title(title: str) -> str:
+    """Normalize a link target the way MediaWiki does for lookups."""
+    title = " ".join(title.replace("_", " ").split())
+    if ":" in title:
+        namespace, _, rest = title.partition(":")
+        if namespace in ("Category", "Template") and rest:
+            return f"{namespace}:{rest[0].upper()}{rest[1:]}"
+    return title[:1].upper() + title[1:]
+
+
+def html_path(page_path: str) -> str:
+    return os.path.splitext(page_path)[0] + ".html"
+
+
+def template_body(wikitext: str) -> str:
+    """Return what a template page contributes when it is transcluded."""
+    included = INCLUDEONLY_RE.findall(wikitext)
+    if included:
+        return "".join(included)
+    return NOINCLUDE_RE.sub("", wikitext)
+
+
+class PageRenderer:
+    """Render pages of one site; holds the title index and template bodies."""
+
+    def __init__(self, title_paths: dict[str, str], templates: dict[str, str]):
+        self.title_paths = {normalize_title(title): path for title, path in title_paths.items()}
+        self.templates = {normalize_title(title): body for title, body in templates.items()}
+
+    # Templates
+
+    def split_call(self, call: str) -> tuple[str, dict[str, str]]:
+        name, *parts = PIPE_OUTSIDE_LINKS_RE.split(call)
+        params = {}
+        for index, part in enumerate(parts, start=1):
+            key, sep, value = part.partition("=")
+            if sep and "[[" not in key:
+                params[key.strip()] = value.strip()
+            else:
+                params[str(index)] = part
+        return name.strip(), params
+
+    def expand(self, wikitext: str, meta: dict, blocks: list[str]) -> str:
+        def substitute(match: re.Match) -> str:
+            name, params = self.split_call(match.group(1))
+            if name.lower() == "short description":
+                meta["description"] = params.get("1", "").strip()
+                return ""
+            body = self.templates.get(normalize_title(f"Template:{name}"))
+            if body is None:
+                return match.group(0)
+            if not params:
+                blocks.append(name)
+                return BLOCK_MARKER.format(len(blocks) - 1)
+            return PARAMETER_RE.sub(lambda m: params.get(m.group(1).strip(), m.group(2) or ""), body)
+
+        # Expand repeatedly so templates that emit template calls resolve too.
+        for _ in range(5):
+            expanded = TEMPLATE_CALL_RE.sub(substitute, wikitext)
+            if expanded == wikitext:
+                break
+            wikitext = expanded
+        return wikitext
+
+    @lru_cache(maxsize=None)
+    def render_template_block(self, name: str, page_dir: str) -> str:
+        body = self.templates[normalize_title(f"Template:{name}")]
+        return self.render_blocks(self.expand(body, {}, []), page_dir, [])
+
+    # Inline markup
+
+    def href(self, target: str, page_dir: str) -> str | None:
+        target, _, fragment = target.partition("#")
+        path = self.title_paths.get(normalize_title(target))
+        if path is None:
+            return None
+        href = os.path.relpath(html_path(path), page_dir or ".").replace(os.sep, "/")
+        return f"{href}#{fragment}" if fragment else href
+
+    def render_inline(self, text: str, page_dir: str, categories: list[str]) -> str:
+        out = []
+        position = 0
+        for match in LINK_RE.finditer(text):
+            out.append(self.render_quotes(html.escape(text[position:match.start()], quote=False)))
+            position = match.end()
+            target, label = match.group(1).strip(), match.group(2)
+            if target.startswith("Category:"):
+                categories.append(target.partition(":")[2].strip())
+                continue
+            target = target.lstrip(":")
+            label = html.escape(target if label is None else label, quote=False)
+            href = self.href(target, page_dir)
+            if href is None:
+                out.append(f'<a class="new" title="{html.escape(target)}">{label}</a>')
+            else:
+                out.append(f'<a href="{html.escape(href)}">{label}</a>')
+        out.append(self.render_quotes(html.escape(text[position:], quote=False)))
+        return "".join(out)
+
+    @staticmethod
+    def render_quotes(text: str) -> str:
+        return ITALIC_RE.sub(r"<i>\1</i>", BOLD_RE.sub(r"<b>\1</b>", text))
+
+    # Blocks
+
+    @staticmethod
+    def attributes(raw: str) -> str:
+        return "".join(f' {name}="{html.escape(value)}"' for name, value in ATTRIBUTE_RE.findall(raw))
+
+    def render_table(self, lines: list[str], page_dir: str, categories: list[str]) -> str:
+        out = [f"<table{self.attributes(lines[0][2:])}>", "<tr>"]
+        cell = None
+
+        def close_cell():
+            if cell is not None:
+                tag, attrs, content = cell
+                if len(content) == 1:
+                    inner = self.render_inline(content[0], page_dir, categories)
+                else:
+                    inner = self.render_blocks("\n".join(content), page_dir, categories)
+                out.append(f"<{tag}{attrs}>{inner}</{tag}>")
+
+        for line in lines[1:]:
+            if line.startswith("|}"):
+                break
+            if line.startswith("|-"):
+                close_cell()
+                cell = None
+                out.append("</tr>\n<tr>")
+            elif line.startswith(("|", "!")):
+                close_cell()
+                tag = "th" if line[0] == "!" else "td"
+                parts = PIPE_OUTSIDE_LINKS_RE.split(line[1:], maxsplit=1)
+                attrs, content = parts if len(parts) == 2 else ("", parts[0])
+                cell = (tag, self.attributes(attrs), [content.strip()])
+            elif cell is not None:
+                cell[2].append(line)
+        close_cell()
+        out.append("</tr>\n</table>")
+        return "\n".join(out)
+
+    def render_blocks(self, wikitext: str, page_dir: str, categories: list[str], headings: list | None = None) -> str:
+        out = []
+        paragraph = []
+        open_list = None
+        lines = wikitext.split("\n")
+
+        def flush():
+            nonlocal open_list
+            if paragraph:
+                text = self.render_inline(" ".join(paragraph), page_dir, categories).strip()
+                if text:
+                    out.append(f"<p>{text}</p>")
+                paragraph.clear()
+            if open_list:
+                out.append(f"</{open_list}>")
+                open_list = None
+
+        index = 0
+        while index < len(lines):
+            line = lines[index].rstrip()
+            index += 1
+            if line.startswith("{|"):
+                flush()
+                table = [line]
+                while index < len(lines) and not lines[index].startswith("|}"):
+                    table.append(lines[index])
+                    index += 1
+                index += 1
+                out.append(self.render_table(table, page_dir, categories))
+                continue
+            heading = HEADING_RE.match(line)
+            if heading:
+                flush()
+                level = len(heading.group(1))
+                text = self.render_inline(heading.group(2), page_dir, categories)
+                anchor = html.escape(heading.group(2).replace(" ", "_"))
+                if headings is not None and level == 2:
+                    headings.append((anchor, text))
+                out.append(f'<h{level} id="{anchor}">{text}</h{level}>')
+                continue
+            if line[:1] in LIST_TAGS:
+                if paragraph:
+                    flush()
+                container, item = LIST_TAGS[line[0]]
+                if open_list != container:
+                    flush()
+                    out.append(f"<{container}>")
+                    open_list = container
+                out.append(f"<{item}>{self.render_inline(line[1:].strip(), page_dir, categories)}</{item}>")
+                continue
+            stripped = line.strip()
+            if not stripped:
+                flush()
+            elif stripped.startswith("\x00block:") or stripped in ("__TOC__", "__NOTOC__"):
+                flush()
+                out.append(stripped)
+            else:
+                if open_list:
+                    flush()
+                paragraph.append(stripped)
+        flush()
+        return "\n".join(out)
+
+    def render_page(self, title: str, page_path: str, wikitext: str) -> str:
+        page_dir = os.path.dirname(page_path)
+        meta = {}
+        blocks = []
+        categories = []
+        headings = []
+        if title.startswith("Template:"):
+            wikitext = NOINCLUDE_RE.sub("", wikitext).replace("<includeonly>", "").replace("</includeonly>", "")
+            wikitext = f"<pre>{html.escape(wikitext)}</pre>"
+            body = wikitext
+        else:
+            body = self.render_blocks(self.expand(wikitext, meta, blocks), page_dir, categories, headings)
+        for index, name in enumerate(blocks):
+            body = body.replace(BLOCK_MARKER.format(index), self.render_template_block(name, page_dir))
+        toc = "".join(f'<li><a href="#{anchor}">{text}</a></li>' for anchor, text in headings)
+        body = body.replace("__TOC__", f'<nav class="toc"><ul>{toc}</ul></nav>' if toc else "").replace("__NOTOC__", "")
+        category_links = " · ".join(self.render_inline(f"[[:Category:{name}|{name}]]", page_dir, []) for name in dict.fromkeys(categories))
+        footer = f'\n<footer class="catlinks">Categories: {category_links}</footer>' if category_links else ""
+        description = f'\n<meta name="description" content="{html.escape(meta["description"])}">' if meta.get("description") else ""
+        stylesheet = os.path.relpath("style.css", page_dir or ".").replace(os.sep, "/")
+        return f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<title>{html.escape(title)} - 2bZ Wiki</title>{description}
+<link rel="stylesheet" href="{stylesheet}">
+</head>
+<body>
+<main>
+{body}
+</main>{footer}
+</body>
+</html>
+"""
+
+
+# Parallel site build
+
+_renderer: PageRenderer | None = None
+_settings: dict = {}
+
+
+def _init_worker(title_paths: dict[str, str], templates: dict[str, str], output_dir: str, cache_dir: str | None) -> None:
+    global _renderer, _settings
+    _renderer = PageRenderer(title_paths, templates)
+    _settings = {"output_dir": output_dir, "cache_dir": cache_dir}
+
+
+def _cache_key(title: str, page_path: str, wikitext: str) -> str:
+    """Key a page on everything its HTML depends on.
+
+    That is its own source plus where each of its links resolves to and the
+    template bodies, so adding an unrelated page does not invalidate it.
+    """
+    digest = hashlib.sha256()
+    for part in (RENDERER_VERSION, title, page_path, wikitext):
+        digest.update(part.encode("utf-8") + b"\x00")
+    for match in LINK_RE.finditer(wikitext):
+        target = normalize_title(match.group(1).lstrip(":").partition("#")[0])
+        digest.update(f"{target}={_renderer.title_paths.get(target)}\x00".encode("utf-8"))
+    for name in sorted(_renderer.templates):
+        digest.update(f"{name}={_renderer.templates[name]}\x00".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _write_if_changed(path: str, data: bytes) -> None:
+    if not content_matches(path, data):
+        replace_file(path, data)
+
+
+def _render_one(page: tuple[str, str, str]) -> bool:
+    """Render and write one page; returns True on a cache hit."""
+    title, page_path, wikitext = page
+    cache_path = None
+    data = None
+    if _settings["cache_dir"]:
+        key = _cache_key(title, page_path, wikitext)
+        cache_path = os.path.join(_settings["cache_dir"], key[:2], key + ".html")
+        try:
+            with open(cache_path, "rb") as handle:
+                data = handle.read()
+        except FileNotFoundError:
+            pass
+    hit = data is not None
+    if data is None:
+        data = _renderer.render_page(title, page_path, wikitext).encode("utf-8")
+        if cache_path:
+            _write_if_changed(cache_path, data)
+    _write_if_changed(os.path.join(_settings["output_dir"], html_path(page_path)), data)
+    return hit
+
+
+def render_site(pages: Iterable[tuple[str, str, str]], output_dir: str, workers: int | None = None, cache_dir: str | None = None) -> dict[str, int]:
+    """Render ``(title, page_path, wikitext)`` triples to HTML under ``output_dir``.
+
+    ``page_path`` is the page's path relative to the wikitext root; the HTML
+    file mirrors it with an ``.html`` suffix. Returns page and cache-hit counts.
+    """
+    pages = list(pages)
+    title_paths = {title: path for title, path, _ in pages}
+    templates = {title: template_body(text) for title, _, text in pages if title.startswith("Template:")}
+    os.makedirs(output_dir, exist_ok=True)
+    _write_if_changed(os.path.join(output_dir, "style.css"), STYLESHEET.encode("utf-8"))
+    initargs = (title_paths, templates, output_dir, cache_dir)
+    if workers == 1:
+        _init_worker(*initargs)
+        hits = sum(map(_render_one, pages))
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=initargs) as pool:
+            chunksize = max(1, len(pages) // ((workers or os.cpu_count() or 1) * 8))
+            hits = sum(pool.map(_render_one, pages, chunksize=chunksize))
+    return {"pages": len(pages), "cache_hits": hits}
+
+
+def read_pages(root: str) -> list[tuple[str, str, str]]:
+    """Load a wikitext tree, taking titles from each page's ``= Title =`` heading.
+
+    Article transclusions have no heading; their title is the ``|title=`` parameter.
+    """
+    from page_ingest import parse_page
+    from page_reader import read_text, scan_pages
+
+    pages = []
+    for entry in scan_pages(root):
+        text = read_text(entry.path)
+        relative = os.path.relpath(entry.path, root)
+        name = os.path.splitext(entry.name)[0]
+        if name.startswith("Template_"):
+            title = "Template:" + name[len("Template_"):].replace("_", " ")
+        else:
+            title = parse_page(text).title or name.replace("_", " ")
+        pages.append((title, relative, text))
+    return pages
+
+
+def main(argv: list[str]) -> None:
+    if len(argv) not in (1, 2):
+        raise SystemExit(__doc__.strip().splitlines()[-1])
+    root = argv[0] if len(argv) == 2 else os.path.join(os.path.dirname(__file__), "..", "pages")
+    stats = render_site(read_pages(root), argv[-1])
+    print(f"Rendered {stats['pages']} HTML pages.")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,175 @@
+"""Link-graph analytics over generated pages: orphans, reachability and centrality.
+
+The ``[[...]]`` links of every page become a CSR adjacency matrix built with
+NumPy; in-degree, breadth-first reachability from ``Main Page`` and a
+PageRank score are then computed with array operations only. Category tags
+count in both directions, mirroring MediaWiki: the page shows a link to its
+category and the category page lists the page. Template calls are expanded
+with their parameters the way the HTML mirror expands them, so links inside
+``{{2bZ Navbox}}`` or an article transclusion count for every page that
+calls the template.
+
+Usage: ``python scripts/link_graph.py [PAGES_DIR]``
+"""
+
+import re
+import sys
+
+from analysis_common import load_numpy
+from html_site import PageRenderer, normalize_title, template_body
+
+LINK_TARGET_RE = re.compile(r"\[\[([^\[\]|\n]+)(?:\|[^\[\]]*)?\]\]")
+
+
+def page_links(wikitext: str) -> tuple[list[str], list[str]]:
+    """Split the links of a page into ordinary targets and category tags."""
+    links, categories = [], []
+    for match in LINK_TARGET_RE.finditer(wikitext):
+        target = match.group(1).strip()
+        if "{{{" in target:
+            continue
+        if target.startswith("Category:"):
+            categories.append(normalize_title(target))
+        else:
+            links.append(normalize_title(target.lstrip(":").partition("#")[0]))
+    return links, categories
+
+
+class LinkGraph:
+    """Directed page graph in compressed sparse row form."""
+
+    def __init__(self, pages: list[tuple[str, str]]):
+        np = load_numpy("The link report")
+        self.titles = [normalize_title(title) for title, _ in pages]
+        self.index = {title: position for position, title in enumerate(self.titles)}
+        renderer = PageRenderer(
+            {}, {title: template_body(text) for title, (_, text) in zip(self.titles, pages) if title.startswith("Template:")}
+        )
+        block_links: dict[str, tuple[list[str], list[str]]] = {}
+
+        def expanded_links(text: str) -> tuple[list[str], list[str]]:
+            blocks: list[str] = []
+            links, categories = page_links(renderer.expand(text, {}, blocks))
+            for name in blocks:
+                if name not in block_links:
+                    # Placeholder first, so a template that includes itself cannot recurse forever.
+                    block_links[name] = ([], [])
+                    block_links[name] = expanded_links(renderer.templates[normalize_title(f"Template:{name}")])
+                links += block_links[name][0]
+                categories += block_links[name][1]
+            return links, categories
+
+        sources, targets = [], []
+        self.broken: dict[str, int] = {}
+
+        def add(source: int, target_title: str) -> None:
+            target = self.index.get(target_title)
+            if target is None:
+                self.broken[target_title] = self.broken.get(target_title, 0) + 1
+            elif target != source:
+                sources.append(source)
+                targets.append(target)
+
+        for source, (title, (_, text)) in enumerate(zip(self.titles, pages)):
+            links, categories = page_links(text) if title.startswith("Template:") else expanded_links(text)
+            for target in links:
+                add(source, target)
+            for category in categories:
+                add(source, category)
+                if category in self.index:
+                    add(self.index[category], title)
+
+        count = len(self.titles)
+        edges = np.unique(np.asarray(sources, dtype=np.int64) * count + np.asarray(targets, dtype=np.int64))
+        self.sources, self.indices = np.divmod(edges, count)
+        self.indptr = np.zeros(count + 1, dtype=np.int64)
+        np.cumsum(np.bincount(self.sources, minlength=count), out=self.indptr[1:])
+        self.np = np
+
+    @property
+    def edge_count(self) -> int:
+        return len(self.indices)
+
+    def in_degree(self):
+        return self.np.bincount(self.indices, minlength=len(self.titles))
+
+    def out_degree(self):
+        return self.np.diff(self.indptr)
+
+    def reachable_from(self, roots: list[str]):
+        """Breadth-first search from ``roots``; returns each page's hop count (-1 if unreachable)."""
+        np = self.np
+        depth = np.full(len(self.titles), -1, dtype=np.int64)
+        frontier = np.asarray([self.index[root] for root in roots if root in self.index], dtype=np.int64)
+        depth[frontier] = 0
+        level = 0
+        while len(frontier):
+            starts = self.indptr[frontier]
+            lengths = self.indptr[frontier + 1] - starts
+            total = int(lengths.sum())
+            if not total:
+                break
+            # Gather all neighbour slices of the frontier in one vectorized step.
+            offsets = np.arange(total) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+            neighbours = np.unique(self.indices[np.repeat(starts, lengths) + offsets])
+            frontier = neighbours[depth[neighbours] < 0]
+            level += 1
+            depth[frontier] = level
+        return depth
+
+    def pagerank(self, damping: float = 0.85, tolerance: float = 1e-10, max_iterations: int = 100):
+        np = self.np
+        count = len(self.titles)
+        out_degree = self.out_degree().astype(np.float64)
+        dangling = out_degree == 0
+        scale = np.divide(1.0, out_degree, out=np.zeros(count), where=~dangling)
+        rank = np.full(count, 1.0 / count)
+        for _ in range(max_iterations):
+            spread = np.bincount(self.indices, weights=(rank * scale)[self.sources], minlength=count)
+            updated = (1 - damping) / count + damping * (spread + rank[dangling].sum() / count)
+            converged = np.abs(updated - rank).sum() < tolerance
+            rank = updated
+            if converged:
+                break
+        return rank
+
+
+def link_report(pages: list[tuple[str, str]], roots: tuple[str, ...] = ("Main Page",), limit: int = 15) -> str:
+    graph = LinkGraph(pages)
+    np = graph.np
+    in_degree = graph.in_degree()
+    depth = graph.reachable_from(list(roots))
+    rank = graph.pagerank()
+    titles = graph.titles
+    orphans = [titles[i] for i in np.flatnonzero(in_degree == 0) if titles[i] not in roots]
+    unreachable = [titles[i] for i in np.flatnonzero(depth < 0)]
+    reachable = depth[depth >= 0]
+
+    lines = [
+        f"Pages: {len(titles)}  links: {graph.edge_count}  broken link targets: {len(graph.broken)}",
+        f"In-degree: min {in_degree.min()}  median {int(np.median(in_degree))}  max {in_degree.max()}",
+        f"Reachable from {', '.join(roots)}: {len(reachable)} of {len(titles)} (max depth {reachable.max() if len(reachable) else 0})",
+        "",
+        f"Orphans (no incoming links): {len(orphans)}",
+        *(f"  {title}" for title in orphans[:limit]),
+        f"Unreachable from {', '.join(roots)}: {len(unreachable)}",
+        *(f"  {title}" for title in unreachable[:limit]),
+        "Most linked-to missing pages:",
+        *(f"  {count:6d}  {title}" for title, count in sorted(graph.broken.items(), key=lambda item: (-item[1], item[0]))[:limit]),
+        "Highest PageRank:",
+        *(f"  {rank[i]:.5f}  {titles[i]}" for i in np.argsort(-rank, kind="stable")[:limit]),
+    ]
+    return "\n".join(lines)
+
+
+def main(argv: list[str]) -> None:
+    import os
+
+    from html_site import read_pages
+
+    root = argv[0] if argv else os.path.join(os.path.dirname(__file__), "..", "pages")
+    print(link_report([(title, text) for title, _, text in read_pages(root)]))
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,154 @@
+"""Per-stage memory accounting and a peak-RSS budget for large builds.
+
+``MemoryTracker.stage(name)`` brackets one phase of the build and records
+the process's peak RSS at its end, together with the peak RSS of the
+largest worker process it has waited for (the HTML stage renders on a
+process pool). With ``trace`` set, ``tracemalloc`` also
+measures the Python heap each stage added and at its highest point, and a
+snapshot comparison names the source lines that allocated the most. With
+a ``budget``, ``check()`` stops the build as soon as peak RSS passes it and
+reports the breakdown so far, instead of leaving it to the OOM killer.
+
+The budget counts this process plus its largest finished worker. The
+kernel only reports a child's peak once it has exited, and only the
+largest one, so a pool of N workers can briefly use up to N times that
+figure; size ``--max-memory`` with that in mind.
+"""
+
+import sys
+import tracemalloc
+from contextlib import contextmanager
+from typing import NamedTuple
+
+try:
+    import resource
+except ImportError:  # Windows has no getrusage; only traced memory is reported there.
+    resource = None
+
+SIZE_UNITS = {"": 1, "K": 1024, "M": 1024 ** 2, "G": 1024 ** 3, "T": 1024 ** 4}
+TRACE_FILTERS = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, __file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+)
+
+
+def parse_size(text: str) -> int:
+    """Parse a byte count such as ``1500000``, ``512M`` or ``2GiB``."""
+    value = text.strip().upper().removesuffix("B").removesuffix("I")
+    unit = value[-1:] if value[-1:] in SIZE_UNITS else ""
+    number = float(value[:len(value) - len(unit)])
+    if number <= 0:
+        raise ValueError(f"memory size must be positive: {text!r}")
+    return int(number * SIZE_UNITS[unit])
+
+
+def format_size(size: int) -> str:
+    if abs(size) < 1024 ** 2:
+        return f"{size / 1024:,.1f} KiB"
+    return f"{size / 1024 ** 2:,.1f} MiB"
+
+
+def _max_rss(who: str) -> int:
+    if resource is None:
+        return 0
+    peak = resource.getrusage(getattr(resource, who)).ru_maxrss
+    # Linux reports kilobytes, macOS bytes.
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def peak_rss() -> int:
+    """Highest resident set size of this process so far, in bytes (0 if unknown)."""
+    return _max_rss("RUSAGE_SELF")
+
+
+def children_peak_rss() -> int:
+    """Highest resident set size of any finished, waited-for child process, in bytes (0 if none)."""
+    return _max_rss("RUSAGE_CHILDREN")
+
+
+class StageUsage(NamedTuple):
+    name: str
+    allocated: int | None
+    traced_peak: int | None
+    rss_peak: int
+    workers_rss_peak: int
+    top_sites: list[str]
+
+
+class MemoryTracker:
+    """Record memory per build stage and enforce an optional peak-RSS budget."""
+
+    def __init__(self, trace: bool = False, budget: int | None = None, top: int = 5):
+        self.trace = trace
+        self.budget = budget
+        self.top = top
+        self.stages: list[StageUsage] = [StageUsage("startup", None, None, peak_rss(), children_peak_rss(), [])]
+        self.current: str | None = None
+        self._stage_start = 0
+        self._snapshot = None
+        if trace:
+            tracemalloc.start()
+            self._snapshot = tracemalloc.take_snapshot().filter_traces(TRACE_FILTERS)
+
+    @contextmanager
+    def stage(self, name: str):
+        self.current = name
+        if self.trace:
+            self._stage_start = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+        try:
+            yield
+        finally:
+            if self.current == name:
+                self.stages.append(self._measure(name))
+                self.current = None
+        self.check()
+
+    def _measure(self, name: str) -> StageUsage:
+        if not self.trace:
+            return StageUsage(name, None, None, peak_rss(), children_peak_rss(), [])
+        current, peak = tracemalloc.get_traced_memory()
+        snapshot = tracemalloc.take_snapshot().filter_traces(TRACE_FILTERS)
+        differences = snapshot.compare_to(self._snapshot, "lineno")
+        self._snapshot = snapshot
+        sites = [
+            f"{format_size(stat.size_diff):>12}  {stat.traceback[0].filename}:{stat.traceback[0].lineno}  ({stat.count_diff:+,} blocks)"
+            for stat in differences[:self.top]
+            if stat.size_diff > 0
+        ]
+        return StageUsage(name, current - self._stage_start, peak - self._stage_start, peak_rss(), children_peak_rss(), sites)
+
+    def check(self) -> None:
+        """Raise SystemExit with the breakdown once peak RSS, workers included, exceeds the budget."""
+        if self.budget is None:
+            return
+        own, workers = peak_rss(), children_peak_rss()
+        rss = own + workers
+        if rss <= self.budget:
+            return
+        where = self.current or self.stages[-1].name
+        if self.current is not None:
+            self.stages.append(self._measure(f"{self.current} (stopped)"))
+            self.current = None
+        breakdown = f" ({format_size(own)} here + {format_size(workers)} largest worker)" if workers else ""
+        raise SystemExit(
+            f"Peak RSS {format_size(rss)}{breakdown} exceeded --max-memory {format_size(self.budget)} during {where}.\n"
+            + self.report()
+        )
+
+    def report(self) -> str:
+        lines = [f"{'stage':<24}{'allocated':>14}{'traced peak':>14}{'peak RSS':>14}{'worker RSS':>14}"]
+        for usage in self.stages:
+            allocated = "-" if usage.allocated is None else format_size(usage.allocated)
+            traced_peak = "-" if usage.traced_peak is None else format_size(usage.traced_peak)
+            workers = format_size(usage.workers_rss_peak) if usage.workers_rss_peak else "-"
+            lines.append(f"{usage.name:<24}{allocated:>14}{traced_peak:>14}{format_size(usage.rss_peak):>14}{workers:>14}")
+        for usage in self.stages:
+            if usage.top_sites:
+                lines.append(f"Top allocation sites in {usage.name}:")
+                lines.extend(f"  {site}" for site in usage.top_sites)
+        if not self.trace:
+            lines.append("Run with --memory-report for per-stage Python allocations and the top allocation sites.")
+        return "\n".join(lines)
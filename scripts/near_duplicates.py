@@ -0,0 +1,103 @@
+"""Flag near-duplicate documents with MinHash signatures and LSH banding.
+
+Each document becomes a set of character trigrams taken within words, so
+"Mob Grinder Layout" and "Layout: Mob Grinders" share most of their
+shingles whatever the word order. A MinHash signature of ``permutations``
+multiply-shift hashes estimates the Jaccard similarity of two sets; the
+signature is cut into ``bands`` and documents that agree on a whole band
+land in the same bucket. Only bucket members are compared, and only with
+the first member of their bucket, so the work stays linear in the number
+of documents instead of growing with every pair.
+"""
+
+import zlib
+
+from analysis_common import TOKEN_RE, load_numpy
+
+FEATURE = "Near-duplicate detection"
+
+
+def shingles(text: str, size: int = 3) -> set[str]:
+    grams = set()
+    for token in TOKEN_RE.findall(text.lower()):
+        padded = f" {token} "
+        grams.update(padded[start:start + size] for start in range(max(1, len(padded) - size + 1)))
+    return grams
+
+
+def minhash_signatures(documents: list[str], permutations: int = 128, seed: int = 0):
+    """Return a ``documents x permutations`` array of 32-bit MinHash values."""
+    np = load_numpy(FEATURE)
+    # crc32 rather than hash(): hash() is salted per process, and --near-duplicates
+    # drop must pick the same pages on every run.
+    sets = [np.fromiter((zlib.crc32(gram.encode("utf-8")) for gram in shingles(text) or {""}), dtype=np.uint64) for text in documents]
+    lengths = np.fromiter(map(len, sets), dtype=np.int64, count=len(sets))
+    values = np.concatenate(sets)
+    starts = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+    rng = np.random.default_rng(seed)
+    multipliers = rng.integers(1, 2 ** 63, size=permutations, dtype=np.uint64) | np.uint64(1)
+    offsets = rng.integers(0, 2 ** 63, size=permutations, dtype=np.uint64)
+    signatures = np.empty((len(documents), permutations), dtype=np.uint32)
+    # Work through the shingles in slices that end on document boundaries,
+    # keeping the (shingles x permutations) intermediate small.
+    block = max(1, (1 << 20) // permutations)
+    first = 0
+    while first < len(documents):
+        last = int(np.searchsorted(starts, starts[first] + block, side="right"))
+        last = max(last, first + 1)
+        stop = starts[last] if last < len(documents) else len(values)
+        hashed = (values[starts[first]:stop, None] * multipliers + offsets) >> np.uint64(32)
+        signatures[first:last] = np.minimum.reduceat(hashed, starts[first:last] - starts[first], axis=0)
+        first = last
+    return signatures
+
+
+def near_duplicate_clusters(documents: list[str], threshold: float = 0.8, permutations: int = 128, bands: int = 16, seed: int = 0) -> list[list[int]]:
+    """Group indices of documents whose estimated Jaccard similarity is at least ``threshold``.
+
+    With the default 16 bands of 8 rows, pairs at 0.8 similarity share a
+    bucket with about 95% probability and pairs below 0.5 rarely do.
+    Returns clusters of two or more indices, each sorted, in order of
+    their first member.
+    """
+    np = load_numpy(FEATURE)
+    count = len(documents)
+    if count < 2:
+        return []
+    signatures = minhash_signatures(documents, permutations, seed)
+    rows = permutations // bands
+    mixers = np.random.default_rng(seed + 1).integers(1, 2 ** 63, size=rows, dtype=np.uint64) | np.uint64(1)
+    sources, targets = [], []
+    for band in range(bands):
+        keys = (signatures[:, band * rows:(band + 1) * rows].astype(np.uint64) * mixers).sum(axis=1)
+        order = np.argsort(keys, kind="stable")
+        sorted_keys = keys[order]
+        boundary = np.empty(count, dtype=bool)
+        boundary[0] = True
+        boundary[1:] = sorted_keys[1:] != sorted_keys[:-1]
+        # Each document is paired with the first document of its bucket.
+        leaders = order[np.maximum.accumulate(np.where(boundary, np.arange(count), 0))]
+        members = ~boundary
+        sources.append(leaders[members])
+        targets.append(order[members])
+    pairs = np.unique(np.concatenate(sources) * count + np.concatenate(targets))
+    first, second = np.divmod(pairs, count)
+    similarity = (signatures[first] == signatures[second]).mean(axis=1)
+    keep = similarity >= threshold
+
+    parent = list(range(count))
+
+    def root(node: int) -> int:
+        while parent[node] != node:
+            parent[node] = parent[parent[node]]
+            node = parent[node]
+        return node
+
+    for a, b in zip(first[keep].tolist(), second[keep].tolist()):
+        ra, rb = root(a), root(b)
+        if ra != rb:
+            parent[max(ra, rb)] = min(ra, rb)
+    clusters: dict[int, list[int]] = {}
+    for node in sorted({node for pair in zip(first[keep].tolist(), second[keep].tolist()) for node in pair}):
+        clusters.setdefault(root(node), []).append(node)
+    return [members for _, members in sorted(clusters.items()) if len(members) > 1]
@@ -0,0 +1,153 @@
+"""Precompressed ``.gz``/``.zst`` siblings for statically served pages."""
+
+import gzip
+import hashlib
+import json
+import os
+import threading
+
+from page_reader import content_matches
+from page_writer import replace_file
+
+COMPRESSED_SUFFIXES = {"gz": ".gz", "zst": ".zst"}
+DEFAULT_LEVELS = {"gz": 9, "zst": 19}
+DICTIONARY_FILENAME = "pages.zdict"
+# The settings the compressed siblings in a tree were last written with.
+SETTINGS_FILENAME = ".compression-settings.json"
+
+
+def load_zstandard():
+    try:
+        import zstandard
+    except ImportError as exc:
+        raise SystemExit("zstd output needs the 'zstandard' package (pip install zstandard)") from exc
+    return zstandard
+
+
+def train_zstd_dictionary(samples: list[bytes], size: int = 110 * 1024) -> bytes:
+    """Train a shared dictionary on rendered pages.
+
+    Pages are mostly identical scaffolding, so a dictionary trained on a
+    sample lets each small file reference the boilerplate instead of storing
+    it. Frames compressed with it can only be read by clients that have the
+    dictionary, so it is meant for mirror transfer and storage, not for
+    serving straight to browsers.
+    """
+    zstandard = load_zstandard()
+    try:
+        return zstandard.train_dictionary(size, samples).as_bytes()
+    except zstandard.ZstdError as exc:
+        raise SystemExit(f"Could not train a zstd dictionary from {len(samples)} sample pages: {exc}") from exc
+
+
+class PageCompressor:
+    """Compress pages on a worker pool and write them next to their plain path.
+
+    zlib and zstd both release the GIL, so threads are enough to keep several
+    cores busy while the main loop carries on rendering.
+    """
+
+    def __init__(self, fmt: str, workers: int | None = None, dictionary: bytes | None = None, level: int | None = None):
+        if fmt not in COMPRESSED_SUFFIXES:
+            raise ValueError(f"unknown compression format: {fmt!r}")
+        if dictionary is not None and fmt != "zst":
+            raise ValueError("a compression dictionary is only supported for zst")
+        # Imported here so builds without --compress never load the pool machinery.
+        from concurrent.futures import ThreadPoolExecutor
+
+        self.fmt = fmt
+        self.suffix = COMPRESSED_SUFFIXES[fmt]
+        self.level = DEFAULT_LEVELS[fmt] if level is None else level
+        self.dictionary_hash = hashlib.sha256(dictionary).hexdigest() if dictionary else None
+        self._workers = workers or min(32, (os.cpu_count() or 1) + 4)
+        self._pool = ThreadPoolExecutor(max_workers=self._workers, thread_name_prefix="compress")
+        self._pending = []
+        self._local = threading.local()
+        self._counts_lock = threading.Lock()
+        # Pages whose sibling was replaced or already identical, and the uncompressed bytes of the replaced ones.
+        self.written = 0
+        self.unchanged = 0
+        self.written_bytes = 0
+        if fmt == "zst":
+            zstandard = load_zstandard()
+            self._zstd_dict = zstandard.ZstdCompressionDict(dictionary) if dictionary else None
+
+    @property
+    def settings(self) -> dict:
+        """Everything besides the page itself that decides the compressed bytes."""
+        return {"format": self.fmt, "level": self.level, "dictionary": self.dictionary_hash}
+
+    def __enter__(self) -> "PageCompressor":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def compress(self, data: bytes) -> bytes:
+        if self.fmt == "gz":
+            # mtime=0 keeps the output reproducible between runs.
+            return gzip.compress(data, compresslevel=self.level, mtime=0)
+        compressor = getattr(self._local, "compressor", None)
+        if compressor is None:
+            zstandard = load_zstandard()
+            compressor = zstandard.ZstdCompressor(level=self.level, dict_data=self._zstd_dict)
+            self._local.compressor = compressor
+        return compressor.compress(data)
+
+    def _write(self, path: str, data: bytes) -> None:
+        # Both formats compress deterministically, so an identical file can stay untouched.
+        compressed = self.compress(data)
+        changed = not content_matches(path + self.suffix, compressed)
+        if changed:
+            replace_file(path + self.suffix, compressed)
+        with self._counts_lock:
+            if changed:
+                self.written += 1
+                self.written_bytes += len(data)
+            else:
+                self.unchanged += 1
+
+    def submit(self, path: str, data: bytes) -> None:
+        # Bound the queue so a huge build cannot buffer every page in memory.
+        if len(self._pending) >= self._workers * 4:
+            from concurrent.futures import wait
+
+            done, not_done = wait(self._pending, return_when="FIRST_COMPLETED")
+            for future in done:
+                future.result()
+            self._pending = list(not_done)
+        self._pending.append(self._pool.submit(self._write, path, data))
+
+    def flush(self) -> None:
+        """Wait until every submitted page has been written."""
+        pending, self._pending = self._pending, []
+        for future in pending:
+            future.result()
+
+    def close(self) -> None:
+        try:
+            for future in self._pending:
+                future.result()
+        finally:
+            self._pending = []
+            self._pool.shutdown(wait=True)
+
+
+def load_compression_settings(root: str) -> dict | None:
+    try:
+        with open(os.path.join(root, SETTINGS_FILENAME), encoding="utf-8") as handle:
+            return json.load(handle)
+    except FileNotFoundError:
+        return None
+
+
+def save_compression_settings(root: str, settings: dict | None) -> None:
+    """Record ``settings`` for the next build; None forgets them, so it recompresses everything."""
+    path = os.path.join(root, SETTINGS_FILENAME)
+    if settings is not None:
+        replace_file(path, json.dumps(settings, sort_keys=True).encode("utf-8"))
+        return
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
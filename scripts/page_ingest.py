@@ -0,0 +1,149 @@
+"""Parse generated pages back into the fields the generator writes.
+
+``parse_page`` reads the Short description, title, Overview, See Also links
+and category tags of a full article or of a ``{{2bZ Article}}`` call in one
+pass over the lines, using plain string tests rather than a regex per
+field. ``ingest_pages`` feeds a single ``scan_pages`` walk to a process
+pool, so a large tree is parsed at roughly the speed it can be read.
+
+Overview paragraphs come back unwrapped, one line each, separated by blank
+lines; See Also holds the link targets of its bullets; categories are the
+standalone ``[[Category:...]]`` lines at the end of the page.
+
+Usage: ``python scripts/page_ingest.py [PAGES_DIR]`` prints one JSON object per page.
+"""
+
+import os
+import sys
+from typing import NamedTuple
+
+from page_reader import read_text, scan_pages
+
+SHORT_DESCRIPTION_PREFIX = "{{Short description|"
+TRANSCLUSION_PREFIX = "{{2bZ Article\n"
+CATEGORY_PREFIX = "[[Category:"
+SERIAL_LIMIT = 1000
+
+
+class PageFields(NamedTuple):
+    title: str | None
+    short_description: str | None
+    overview: str | None
+    see_also: list[str] | None
+    categories: list[str]
+
+
+def join_paragraphs(lines: list[str]) -> str:
+    """Undo line wrapping: lines join with spaces, blank lines separate paragraphs."""
+    paragraphs, current = [], []
+    for line in lines:
+        if line.strip():
+            current.append(line.strip())
+        elif current:
+            paragraphs.append(" ".join(current))
+            current = []
+    if current:
+        paragraphs.append(" ".join(current))
+    return "\n\n".join(paragraphs)
+
+
+def bullet_targets(lines: list[str]) -> list[str]:
+    """Return the first link target of every ``*`` bullet."""
+    targets = []
+    for line in lines:
+        if not line.startswith("*"):
+            continue
+        start = line.find("[[")
+        end = line.find("]]", start)
+        if start >= 0 and end > start:
+            targets.append(line[start + 2:end].partition("|")[0].strip())
+    return targets
+
+
+def category_tag(line: str) -> str | None:
+    line = line.strip()
+    if line.startswith(CATEGORY_PREFIX) and line.endswith("]]") and line.count("[[") == 1:
+        return line[len(CATEGORY_PREFIX):-2].partition("|")[0].strip()
+    return None
+
+
+def parse_page(text: str) -> PageFields:
+    if text.startswith(TRANSCLUSION_PREFIX):
+        return parse_transclusion(text)
+    title = short_description = None
+    section = None
+    overview_lines: list[str] = []
+    see_also_lines: list[str] | None = None
+    categories: list[str] = []
+    for line in text.split("\n"):
+        if line.startswith("=="):
+            section = line.strip().strip("=").strip()
+            if section == "See Also":
+                see_also_lines = []
+            continue
+        if line.startswith("= ") and title is None:
+            title = line.strip().strip("=").strip()
+            continue
+        if line.startswith(SHORT_DESCRIPTION_PREFIX) and short_description is None:
+            short_description = line[len(SHORT_DESCRIPTION_PREFIX):line.rfind("}}")]
+            continue
+        category = category_tag(line)
+        if category is not None:
+            categories.append(category)
+        elif section == "Overview":
+            overview_lines.append(line)
+        elif section == "See Also":
+            see_also_lines.append(line)
+    overview = join_paragraphs(overview_lines) if overview_lines else None
+    see_also = bullet_targets(see_also_lines) if see_also_lines is not None else None
+    return PageFields(title, short_description, overview, see_also, categories)
+
+
+def parse_transclusion(text: str) -> PageFields:
+    call, _, rest = text[len(TRANSCLUSION_PREFIX):].partition("\n}}")
+    params = {}
+    for part in ("\n" + call).split("\n|")[1:]:
+        name, _, value = part.partition("=")
+        params[name.strip()] = value
+    categories = [params["category"], "2bZ Wiki"] if "category" in params else ["2bZ Wiki"]
+    categories += [tag for tag in map(category_tag, rest.split("\n")) if tag is not None]
+    overview = params.get("overview")
+    see_also = params.get("see_also")
+    return PageFields(
+        params.get("title"),
+        params.get("short_description"),
+        join_paragraphs(overview.split("\n")) if overview is not None else None,
+        bullet_targets(see_also.split("\n")) if see_also is not None else None,
+        categories,
+    )
+
+
+def parse_file(path: str) -> PageFields:
+    return parse_page(read_text(path))
+
+
+def ingest_pages(root: str, workers: int | None = None) -> dict[str, PageFields]:
+    """Parse every page below ``root``; keys are paths relative to ``root``."""
+    paths = [entry.path for entry in scan_pages(root)]
+    if workers == 1 or (workers is None and len(paths) < SERIAL_LIMIT):
+        # Below a few thousand small files, starting worker processes costs more than it saves.
+        fields = map(parse_file, paths)
+        return {os.path.relpath(path, root): parsed for path, parsed in zip(paths, fields)}
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        chunksize = max(1, len(paths) // ((workers or os.cpu_count() or 1) * 8))
+        fields = pool.map(parse_file, paths, chunksize=chunksize)
+        return {os.path.relpath(path, root): parsed for path, parsed in zip(paths, fields)}
+
+
+def main(argv: list[str]) -> None:
+    import json
+
+    root = argv[0] if argv else os.path.join(os.path.dirname(__file__), "..", "pages")
+    for path, fields in sorted(ingest_pages(root).items()):
+        print(json.dumps({"path": path, **fields._asdict()}, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
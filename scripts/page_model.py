@@ -0,0 +1,321 @@
+"""Typed document model for generated pages, rendered to several formats.
+
+Page builders describe a page once as a list of block nodes (headings,
+paragraphs, lists, category tags, ...) whose text is a list of inline nodes
+(text, bold, italic, links). ``render`` walks the blocks a single time and
+hands every node to each renderer it was given, so the wikitext and the
+Markdown for a page come out of one pass. ``MediaWikiRenderer`` reproduces
+the generator's wikitext byte for byte; ``MarkdownRenderer`` follows
+MediaWiki's semantics, e.g. a ``[[Category:...]]`` link anywhere is a
+category tag.
+
+HTML is deliberately not one of the formats. The ``--html`` mirror is
+rendered afterwards by ``html_site`` from the finished wikitext, in a
+second pass that keeps every page in memory. It has to be that way for
+now: the mirror expands template calls, the navbox table and article
+transclusions, and the model represents a template only by its name.
+Rendering HTML in this traversal would first need the templates modelled
+as block trees, and ``html_site`` would still be needed for trees read
+back from disk. Until then only the wikitext and Markdown come out of
+one pass.
+"""
+
+import os
+import re
+from typing import Callable, NamedTuple
+
+from html_site import normalize_title
+from wikiwrap import wrap_text
+
+INLINE_LINK_RE = re.compile(r"\[\[([^\[\]|]+)(?:\|([^\[\]]*))?\]\]")
+QUOTES_RE = re.compile(r"'''(.+?)'''|''(.+?)''")
+MARKDOWN_SPECIAL_RE = re.compile(r"([\\`*_\[\]<>#])")
+
+
+# Inline nodes
+
+class Text(NamedTuple):
+    text: str
+    kind = "text"
+
+
+class Bold(NamedTuple):
+    text: str
+    kind = "bold"
+
+
+class Italic(NamedTuple):
+    text: str
+    kind = "italic"
+
+
+class Link(NamedTuple):
+    target: str
+    label: str | None = None
+    kind = "link"
+
+
+# Block nodes
+
+class ShortDescription(NamedTuple):
+    text: str
+    kind = "short_description"
+
+
+class Heading(NamedTuple):
+    level: int
+    content: list
+    kind = "heading"
+
+
+class Template(NamedTuple):
+    """A parameterless template call such as ``{{2bZ Navbox}}``."""
+
+    name: str
+    kind = "template"
+
+
+class TableOfContents(NamedTuple):
+    show: bool
+    kind = "table_of_contents"
+
+
+class Paragraph(NamedTuple):
+    content: list
+    width: int | None = None
+    kind = "paragraph"
+
+
+class BulletList(NamedTuple):
+    items: list[list]
+    kind = "bullet_list"
+
+
+class NumberedList(NamedTuple):
+    items: list[list]
+    kind = "numbered_list"
+
+
+class CategoryTag(NamedTuple):
+    category: str
+    kind = "category_tag"
+
+
+class Raw(NamedTuple):
+    """Wikitext passed through as is, such as template parameters."""
+
+    text: str
+    kind = "raw"
+
+
+def parse_inline(wikitext: str) -> list:
+    """Turn a line of generator wikitext into inline nodes.
+
+    Only links and bold/italic quotes are recognised; everything else stays
+    text, so rendering the nodes back to wikitext gives the input unchanged.
+    """
+    nodes = []
+    position = 0
+    for match in INLINE_LINK_RE.finditer(wikitext):
+        nodes.extend(_parse_quotes(wikitext[position:match.start()]))
+        nodes.append(Link(match.group(1), match.group(2)))
+        position = match.end()
+    nodes.extend(_parse_quotes(wikitext[position:]))
+    return nodes
+
+
+def _parse_quotes(text: str) -> list:
+    nodes = []
+    position = 0
+    for match in QUOTES_RE.finditer(text):
+        if match.start() > position:
+            nodes.append(Text(text[position:match.start()]))
+        nodes.append(Bold(match.group(1)) if match.group(1) is not None else Italic(match.group(2)))
+        position = match.end()
+    if position < len(text):
+        nodes.append(Text(text[position:]))
+    return nodes
+
+
+def link_resolver(title_paths: dict[str, str], page_path: str, suffix: str) -> Callable[[str], str | None]:
+    """Map link targets to relative URLs of sibling files with ``suffix``.
+
+    ``title_paths`` maps normalized titles to page paths relative to the
+    output root; unknown targets resolve to None.
+    """
+    page_dir = os.path.dirname(page_path) or "."
+
+    def href(target: str) -> str | None:
+        title, _, fragment = target.lstrip(":").partition("#")
+        path = title_paths.get(normalize_title(title))
+        if path is None:
+            return None
+        url = os.path.relpath(os.path.splitext(path)[0] + suffix, page_dir).replace(os.sep, "/")
+        return f"{url}#{fragment}" if fragment else url
+
+    return href
+
+
+class Renderer:
+    """Accumulates one page in one output format.
+
+    Subclasses implement a method per node ``kind``. Block methods return
+    the block's text, or None when the format has nothing to show for it;
+    ``separator`` decides what goes between two emitted blocks.
+    """
+
+    def __init__(self, href: Callable[[str], str | None] | None = None):
+        self.href = href or (lambda target: None)
+        self.parts: list[str] = []
+        self.categories: list[str] = []
+        self.previous = None
+
+    def add(self, block) -> None:
+        text = getattr(self, block.kind)(block)
+        if text is None:
+            return
+        if self.previous is not None:
+            self.parts.append(self.separator(self.previous, block))
+        self.parts.append(text)
+        self.previous = block
+
+    def separator(self, previous, block) -> str:
+        return "\n\n"
+
+    def inline(self, nodes: list) -> str:
+        return "".join(getattr(self, node.kind)(node) for node in nodes)
+
+    def category_link(self, target: str) -> bool:
+        """Record ``[[Category:...]]`` links as tags, as MediaWiki does."""
+        if target.strip().startswith("Category:"):
+            self.categories.append(target.partition(":")[2].strip())
+            return True
+        return False
+
+    def finish(self) -> str:
+        return "".join(self.parts)
+
+
+class MediaWikiRenderer(Renderer):
+    def separator(self, previous, block) -> str:
+        # Page header lines, a heading and its body, and runs of category
+        # tags are on consecutive lines; everything else has a blank line.
+        if previous.kind in ("short_description", "template", "heading"):
+            return "\n"
+        if previous.kind == block.kind == "category_tag":
+            return "\n"
+        return "\n\n"
+
+    def text(self, node: Text) -> str:
+        return node.text
+
+    def bold(self, node: Bold) -> str:
+        return f"'''{node.text}'''"
+
+    def italic(self, node: Italic) -> str:
+        return f"''{node.text}''"
+
+    def link(self, node: Link) -> str:
+        if node.label is None:
+            return f"[[{node.target}]]"
+        return f"[[{node.target}|{node.label}]]"
+
+    def short_description(self, node: ShortDescription) -> str:
+        return f"{{{{Short description|{node.text}}}}}"
+
+    def heading(self, node: Heading) -> str:
+        marks = "=" * node.level
+        return f"{marks} {self.inline(node.content)} {marks}"
+
+    def template(self, node: Template) -> str:
+        return f"{{{{{node.name}}}}}"
+
+    def table_of_contents(self, node: TableOfContents) -> str:
+        return "__TOC__" if node.show else "__NOTOC__"
+
+    def paragraph(self, node: Paragraph) -> str:
+        text = self.inline(node.content)
+        return wrap_text(text, width=node.width) if node.width else text
+
+    def bullet_list(self, node: BulletList) -> str:
+        return "\n".join(f"* {self.inline(item)}" for item in node.items)
+
+    def numbered_list(self, node: NumberedList) -> str:
+        return "\n".join(f"# {self.inline(item)}" for item in node.items)
+
+    def category_tag(self, node: CategoryTag) -> str:
+        return f"[[Category:{node.category}]]"
+
+    def raw(self, node: Raw) -> str:
+        return node.text
+
+
+def markdown_escape(text: str) -> str:
+    return MARKDOWN_SPECIAL_RE.sub(r"\\\1", text)
+
+
+class MarkdownRenderer(Renderer):
+    def text(self, node: Text) -> str:
+        return markdown_escape(node.text)
+
+    def bold(self, node: Bold) -> str:
+        return f"**{markdown_escape(node.text)}**"
+
+    def italic(self, node: Italic) -> str:
+        return f"*{markdown_escape(node.text)}*"
+
+    def link(self, node: Link) -> str:
+        if self.category_link(node.target):
+            return ""
+        label = markdown_escape(node.target.lstrip(":") if node.label is None else node.label)
+        href = self.href(node.target)
+        return label if href is None else f"[{label}](<{href}>)"
+
+    def short_description(self, node: ShortDescription) -> None:
+        return None
+
+    def heading(self, node: Heading) -> str:
+        return f"{'#' * node.level} {self.inline(node.content)}"
+
+    def template(self, node: Template) -> None:
+        return None
+
+    def table_of_contents(self, node: TableOfContents) -> None:
+        return None
+
+    def paragraph(self, node: Paragraph) -> str:
+        return self.inline(node.content)
+
+    def bullet_list(self, node: BulletList) -> str | None:
+        # A bullet holding only a [[Category:...]] tag shows nothing; the tag
+        # is listed in the Categories footer instead.
+        items = [text for text in map(self.inline, node.items) if text]
+        return "\n".join(f"- {text}" for text in items) if items else None
+
+    def numbered_list(self, node: NumberedList) -> str:
+        return "\n".join(f"{number}. {self.inline(item)}" for number, item in enumerate(node.items, start=1))
+
+    def category_tag(self, node: CategoryTag) -> None:
+        self.categories.append(node.category)
+        return None
+
+    def raw(self, node: Raw) -> str:
+        return f"```mediawiki\n{node.text}\n```"
+
+    def finish(self) -> str:
+        if self.categories:
+            links = ", ".join(self.link(Link(f":Category:{name}", name)) for name in dict.fromkeys(self.categories))
+            self.parts.append(f"\n\nCategories: {links}")
+        return "".join(self.parts) + "\n"
+
+
+def render(blocks: list, *renderers: Renderer) -> tuple[str, ...]:
+    """Render ``blocks`` with every renderer in a single traversal."""
+    for block in blocks:
+        for renderer in renderers:
+            renderer.add(block)
+    return tuple(renderer.finish() for renderer in renderers)
+
+
+def to_wikitext(blocks: list) -> str:
+    return render(blocks, MediaWikiRenderer())[0]
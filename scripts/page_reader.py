@@ -0,0 +1,72 @@
+"""Read back an existing ``pages/`` tree without copying files into Python strings.
+
+Files are opened with ``mmap`` so comparisons against freshly rendered
+pages work directly on the page cache instead of reading every file into a
+new ``bytes`` object. Tools that parse pages (ingest, the HTML mirror, the
+link report) need text, so ``read_text`` decodes straight from the mapping
+without the intermediate copy a buffered ``read()`` makes.
+"""
+
+import mmap
+import os
+from contextlib import contextmanager
+from typing import Iterator
+
+PAGE_SUFFIX = ".mediawiki"
+
+
+def scan_pages(root: str, suffix: str = PAGE_SUFFIX) -> Iterator[os.DirEntry]:
+    """Yield every page file below ``root`` in one ``os.scandir`` walk.
+
+    The entries carry cached ``stat`` data, so callers can compare sizes
+    before touching file contents at all.
+    """
+    stack = [root]
+    while stack:
+        try:
+            iterator = os.scandir(stack.pop())
+        except FileNotFoundError:
+            continue
+        with iterator:
+            subdirs = []
+            for entry in iterator:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                elif entry.name.endswith(suffix) and entry.is_file():
+                    yield entry
+        # Reversed so directories are visited in the order scandir listed them.
+        stack.extend(reversed(subdirs))
+
+
+@contextmanager
+def mapped(path: str) -> Iterator[memoryview]:
+    """Map ``path`` read-only and yield a view of its contents.
+
+    Empty files cannot be mapped, so they produce an empty view instead.
+    """
+    with open(path, "rb") as handle:
+        if os.fstat(handle.fileno()).st_size == 0:
+            yield memoryview(b"")
+            return
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            view = memoryview(buffer)
+            try:
+                yield view
+            finally:
+                view.release()
+
+
+def read_text(path: str) -> str:
+    with mapped(path) as view:
+        return str(view, "utf-8")
+
+
+def content_matches(path: str, data: bytes) -> bool:
+    """Return True when ``path`` already holds exactly ``data``."""
+    try:
+        if os.stat(path).st_size != len(data):
+            return False
+        with mapped(path) as view:
+            return view == data
+    except FileNotFoundError:
+        return False
@@ -0,0 +1,180 @@
+"""Preview single generated pages without running the full build.
+
+Usage: ``python scripts/preview_server.py [--port 8000] [--cache-bytes N]``
+
+``GET /wiki/<Title>`` returns the page's wikitext and ``/html/<Title>`` an
+HTML rendering; ``/`` lists every title. The data tables are loaded once;
+rendered pages are kept in a size-bounded LRU cache that is dropped whenever
+one of the generator's sources (``build_pages.GENERATOR_SOURCES``) changes on
+disk, so edits to ``categories``, ``SUMMARY_TEMPLATES`` or the page model show
+up on the next request. Nothing is written to disk.
+"""
+
+import argparse
+import html
+import importlib
+import os
+import sys
+import threading
+import time
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import quote, unquote
+
+import build_pages
+from html_site import PageRenderer, normalize_title, template_body
+
+
+class LruRenderCache:
+    """LRU mapping of keys to rendered bytes, bounded by total size."""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict = OrderedDict()
+
+    def get(self, key):
+        value = self._entries.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return value
+
+    def put(self, key, value: bytes) -> None:
+        if len(value) > self.max_bytes:
+            return
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self.size -= len(previous)
+        self._entries[key] = value
+        self.size += len(value)
+        while self.size > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self.size -= len(evicted)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.size = 0
+
+
+class PreviewSite:
+    """Title index over the planned pages, reloaded when the source changes."""
+
+    def __init__(self, cache_bytes: int, transclude: bool = False, category_page_size: int | None = None):
+        self.cache = LruRenderCache(cache_bytes)
+        self.plan_options = {"transclude": transclude, "category_page_size": category_page_size}
+        self.lock = threading.Lock()
+        self.source_mtime = None
+        self.load()
+
+    def load(self) -> None:
+        self.source_mtime = self.source_mtimes()
+        specs = build_pages.plan_pages(build_pages.categories, build_pages.CATEGORY_PAGE_DATA, build_pages.GENERAL_PAGES, **self.plan_options)
+        self.specs = {normalize_title(spec.title): spec for spec in specs}
+        self.renderer = PageRenderer(
+            {spec.title: spec.path for spec in specs},
+            {spec.title: template_body(build_pages.render_page(spec)) for spec in specs if spec.title.startswith("Template:")},
+        )
+        self.cache.clear()
+
+    @staticmethod
+    def source_mtimes() -> tuple[int, ...]:
+        directory = os.path.dirname(os.path.abspath(build_pages.__file__))
+        return tuple(os.stat(os.path.join(directory, name)).st_mtime_ns for name in build_pages.GENERATOR_SOURCES)
+
+    def refresh(self) -> None:
+        """Reload the generator if any of its sources were edited since the last load."""
+        if self.source_mtimes() != self.source_mtime:
+            # build_pages binds names from the other sources, so reload them
+            # first; reversed, the list has every module after its imports.
+            for name in reversed(build_pages.GENERATOR_SOURCES):
+                importlib.reload(sys.modules[os.path.splitext(name)[0]])
+            self.load()
+
+    def render(self, title: str, fmt: str) -> bytes | None:
+        with self.lock:
+            self.refresh()
+            spec = self.specs.get(normalize_title(title))
+            if spec is None:
+                return None
+            key = (spec.title, fmt)
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+            wikitext = build_pages.render_page(spec)
+            if fmt == "html":
+                body = self.renderer.render_page(spec.title, spec.path, wikitext)
+            else:
+                body = build_pages.page_bytes(wikitext).decode("utf-8")
+            rendered = body.encode("utf-8")
+            self.cache.put(key, rendered)
+            return rendered
+
+    def index(self) -> bytes:
+        with self.lock:
+            self.refresh()
+            items = "\n".join(
+                f'<li><a href="/html/{quote(spec.title)}">{html.escape(spec.title)}</a> '
+                f'(<a href="/wiki/{quote(spec.title)}">wikitext</a>)</li>'
+                for spec in self.specs.values()
+            )
+        return f"<!DOCTYPE html>\n<title>2bZ wiki preview</title>\n<ul>\n{items}\n</ul>\n".encode("utf-8")
+
+
+def make_handler(site: PreviewSite):
+    class PreviewHandler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            started = time.perf_counter()
+            path = self.path.split("?", 1)[0]
+            if path == "/":
+                self.respond(200, "text/html", site.index())
+                return
+            prefix, _, title = path.lstrip("/").partition("/")
+            if prefix not in ("wiki", "html") or not title:
+                self.respond(404, "text/plain", b"Not found\n")
+                return
+            fmt = "html" if prefix == "html" else "wikitext"
+            body = site.render(unquote(title), fmt)
+            if body is None:
+                self.respond(404, "text/plain", f"No generated page titled {unquote(title)!r}\n".encode("utf-8"))
+                return
+            content_type = "text/html" if fmt == "html" else "text/plain"
+            self.respond(200, content_type, body, {"Server-Timing": f"render;dur={(time.perf_counter() - started) * 1000:.2f}"})
+
+        def respond(self, status: int, content_type: str, body: bytes, headers: dict | None = None) -> None:
+            self.send_response(status)
+            self.send_header("Content-Type", f"{content_type}; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            for name, value in (headers or {}).items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(body)
+
+    return PreviewHandler
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Serve on-demand previews of generated 2bZ wiki pages.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--cache-bytes", type=int, default=64 * 1024 * 1024, help="upper bound for cached renders (default: 64 MiB)")
+    parser.add_argument("--transclude", action="store_true", help="preview articles as {{2bZ Article}} calls")
+    parser.add_argument("--category-page-size", type=int, metavar="N", help="preview paginated category pages")
+    args = parser.parse_args(argv)
+    site = PreviewSite(args.cache_bytes, args.transclude, args.category_page_size)
+    server = ThreadingHTTPServer((args.host, args.port), make_handler(site))
+    print(f"Previewing {len(site.specs)} pages at http://{args.host}:{args.port}/")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
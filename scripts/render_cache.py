@@ -0,0 +1,104 @@
+"""Content-addressed cache of rendered pages that persists across runs.
+
+Entries live at ``DIR/ab/abcdef....page``, named by a hash of everything the
+page depends on, so a cache directory restored from a CI artifact serves
+any checkout with the same inputs and generator version. Entries are
+written to a unique temporary file and renamed into place, which keeps
+concurrent readers and writers (several builds sharing one directory)
+from ever seeing a partial entry. A hit refreshes the entry's mtime, and
+``prune`` evicts the least recently used entries once the directory grows
+past its size budget.
+"""
+
+import hashlib
+import os
+import tempfile
+
+ENTRY_SUFFIX = ".page"
+
+
+class RenderCache:
+    def __init__(self, directory: str, max_bytes: int | None = None):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(*parts: str) -> str:
+        digest = hashlib.sha256()
+        for part in parts:
+            digest.update(part.encode("utf-8") + b"\x00")
+        return digest.hexdigest()
+
+    def path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], key + ENTRY_SUFFIX)
+
+    def get(self, key: str) -> bytes | None:
+        path = self.path(key)
+        try:
+            with open(path, "rb") as handle:
+                data = handle.read()
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            # Evicted or read-only since we opened it; the data is still good.
+            pass
+        self.hits += 1
+        return data
+
+    def put(self, key: str, data: bytes) -> None:
+        path = self.path(key)
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+        fd, staged = tempfile.mkstemp(prefix=".", suffix=".tmp", dir=directory)
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                handle.write(data)
+            os.replace(staged, path)
+        except BaseException:
+            try:
+                os.unlink(staged)
+            except FileNotFoundError:
+                pass
+            raise
+
+    def prune(self) -> int:
+        """Delete least recently used entries until the cache fits ``max_bytes``; returns the number removed."""
+        if self.max_bytes is None:
+            return 0
+        entries = []
+        total = 0
+        try:
+            shards = list(os.scandir(self.directory))
+        except FileNotFoundError:
+            return 0
+        for shard in shards:
+            if not shard.is_dir(follow_symlinks=False):
+                continue
+            with os.scandir(shard.path) as iterator:
+                for entry in iterator:
+                    if not entry.name.endswith(ENTRY_SUFFIX):
+                        continue
+                    try:
+                        stat = entry.stat(follow_symlinks=False)
+                    except FileNotFoundError:
+                        continue
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+                    total += stat.st_size
+        removed = 0
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                # Another build evicted it first.
+                pass
+            total -= size
+            removed += 1
+        return removed
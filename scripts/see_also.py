@@ -0,0 +1,112 @@
+"""Pick See Also links by text similarity instead of list order.
+
+Every article's title and summary become a TF-IDF weighted bag of words,
+hashed into a fixed number of signed dimensions so memory stays at
+``pages x dimensions`` floats whatever the vocabulary. Neighbours are the
+highest cosine similarities across all categories, computed with blocked
+matrix products. Above ``exact_limit`` pages an inverted-file search
+compares each page only with the clusters nearest to its own, which keeps
+100k-page corpora to seconds at a small cost in recall.
+"""
+
+import zlib
+
+from analysis_common import TOKEN_RE, load_numpy
+
+FEATURE = "Similarity-based See Also"
+STOPWORDS = frozenset(
+    "a an and are as at be by for from in into is it of on or so that the this to while with".split()
+)
+
+
+def tfidf_matrix(texts: list[str], dimensions: int = 512):
+    """Return L2-normalised hashed TF-IDF vectors, one row per text."""
+    np = load_numpy(FEATURE)
+    vocabulary: dict[str, int] = {}
+    doc_ids, term_ids = [], []
+    for doc, text in enumerate(texts):
+        for token in TOKEN_RE.findall(text.lower()):
+            if token in STOPWORDS:
+                continue
+            doc_ids.append(doc)
+            term_ids.append(vocabulary.setdefault(token, len(vocabulary)))
+    matrix = np.zeros((len(texts), dimensions), dtype=np.float32)
+    if not vocabulary:
+        return matrix
+    pairs, counts = np.unique(np.asarray(doc_ids, dtype=np.int64) * len(vocabulary) + np.asarray(term_ids), return_counts=True)
+    docs, terms = np.divmod(pairs, len(vocabulary))
+    document_frequency = np.bincount(terms, minlength=len(vocabulary))
+    idf = np.log((1 + len(texts)) / (1 + document_frequency)) + 1
+    hashes = np.fromiter((zlib.crc32(token.encode("utf-8")) for token in vocabulary), dtype=np.uint32, count=len(vocabulary))
+    columns = (hashes % dimensions).astype(np.int64)
+    signs = np.where(hashes & 0x80000000, -1.0, 1.0).astype(np.float32)
+    weights = (1 + np.log(counts)) * idf[terms] * signs[terms]
+    np.add.at(matrix, (docs, columns[terms]), weights.astype(np.float32))
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    np.divide(matrix, norms, out=matrix, where=norms > 0)
+    return matrix
+
+
+def _top_k(np, scores, k: int):
+    """Column indices of the ``k`` best scores per row, best first."""
+    k = min(k, scores.shape[1])
+    if k <= 0:
+        return np.empty((scores.shape[0], 0), dtype=np.int64)
+    best = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+    order = np.argsort(-np.take_along_axis(scores, best, axis=1), axis=1, kind="stable")
+    return np.take_along_axis(best, order, axis=1)
+
+
+def exact_neighbors(matrix, k: int, block_size: int = 1024):
+    np = load_numpy(FEATURE)
+    count = matrix.shape[0]
+    result = np.empty((count, min(k, count - 1)), dtype=np.int64)
+    for start in range(0, count, block_size):
+        stop = min(start + block_size, count)
+        scores = matrix[start:stop] @ matrix.T
+        scores[np.arange(stop - start), np.arange(start, stop)] = -np.inf
+        result[start:stop] = _top_k(np, scores, k)
+    return result
+
+
+def approximate_neighbors(matrix, k: int, probes: int = 4, iterations: int = 3, seed: int = 0, block_size: int = 4096):
+    """Inverted-file search: cluster the rows, then search only nearby clusters."""
+    np = load_numpy(FEATURE)
+    count = matrix.shape[0]
+    clusters = max(1, int(count ** 0.5))
+    rng = np.random.default_rng(seed)
+    centroids = matrix[rng.choice(count, clusters, replace=False)].copy()
+    assignment = np.empty(count, dtype=np.int64)
+    for _ in range(iterations):
+        for start in range(0, count, block_size):
+            assignment[start:start + block_size] = np.argmax(matrix[start:start + block_size] @ centroids.T, axis=1)
+        sums = np.zeros_like(centroids)
+        np.add.at(sums, assignment, matrix)
+        norms = np.linalg.norm(sums, axis=1, keepdims=True)
+        centroids = np.where(norms > 0, sums / np.maximum(norms, 1e-12), centroids)
+    nearby = _top_k(np, centroids @ centroids.T, probes)
+    members = [np.flatnonzero(assignment == cluster) for cluster in range(clusters)]
+    result = np.full((count, k), -1, dtype=np.int64)
+    for cluster in range(clusters):
+        queries = members[cluster]
+        if not len(queries):
+            continue
+        candidates = np.concatenate([members[other] for other in nearby[cluster]])
+        scores = matrix[queries] @ matrix[candidates].T
+        scores[candidates[None, :] == queries[:, None]] = -np.inf
+        best = candidates[_top_k(np, scores, k)]
+        result[queries, :best.shape[1]] = best
+    return result
+
+
+def similar_see_also(documents: list[tuple[str, str]], k: int = 3, exact_limit: int = 20000, dimensions: int = 512) -> dict[str, list[str]]:
+    """Map each ``(title, text)`` document to the titles of its ``k`` nearest neighbours."""
+    if len(documents) < 2:
+        return {title: [] for title, _ in documents}
+    matrix = tfidf_matrix([f"{title} {text}" for title, text in documents], dimensions)
+    if len(documents) <= exact_limit:
+        neighbors = exact_neighbors(matrix, k)
+    else:
+        neighbors = approximate_neighbors(matrix, k)
+    titles = [title for title, _ in documents]
+    return {titles[row]: [titles[col] for col in cols if col >= 0] for row, cols in enumerate(neighbors.tolist())}
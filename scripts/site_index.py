@@ -0,0 +1,136 @@
+"""Sitemaps and a JSON Lines page index, streamed while pages are written.
+
+The generator hands every page to these writers as it renders it, so the
+static mirror's ``sitemap.xml`` and a machine-readable listing of the pages
+come out of the build itself instead of a second walk over the output tree.
+
+``SitemapWriter`` starts a new ``sitemap-N.xml`` whenever the current one
+would pass the protocol limits (50,000 URLs or 50 MiB uncompressed) and
+finishes with a ``sitemap.xml`` index pointing at every part. The parts
+are listed relative to the base URL, so the sitemap directory is expected
+to be published at the mirror's root. ``PageIndexWriter`` writes one JSON
+object per page with its title, path, category and the SHA-256 of its
+content. Both stage to temporary files and only replace the published
+files once the build has finished.
+"""
+
+import hashlib
+import json
+import os
+import re
+from urllib.parse import quote
+from xml.sax.saxutils import escape
+
+from page_writer import replace_file, temporary_path
+
+SITEMAP_MAX_URLS = 50_000
+SITEMAP_MAX_BYTES = 50 * 1024 * 1024
+SITEMAP_INDEX_FILENAME = "sitemap.xml"
+SITEMAP_PART_FILENAME = "sitemap-{}.xml"
+SITEMAP_PART_RE = re.compile(r"sitemap-(\d+)\.xml\Z")
+SITEMAP_NAMESPACE = "http://www.sitemaps.org/schemas/sitemap/0.9"
+XML_DECLARATION = '<?xml version="1.0" encoding="UTF-8"?>\n'
+URLSET_HEADER = f'{XML_DECLARATION}<urlset xmlns="{SITEMAP_NAMESPACE}">\n'.encode("utf-8")
+URLSET_FOOTER = b"</urlset>\n"
+
+
+class SitemapWriter:
+    def __init__(self, directory: str, base_url: str, max_urls: int = SITEMAP_MAX_URLS, max_bytes: int = SITEMAP_MAX_BYTES):
+        self.directory = directory
+        self.base_url = base_url.rstrip("/") + "/"
+        self.max_urls = max_urls
+        self.max_bytes = max_bytes
+        self.parts: list[str] = []
+        self.urls = 0
+        self._handle = None
+        self._part_urls = 0
+        self._part_bytes = 0
+
+    def url(self, path: str) -> str:
+        return self.base_url + quote(path.replace(os.sep, "/"))
+
+    def add(self, path: str) -> None:
+        """Add the page published at ``path`` below the base URL."""
+        entry = f"<url><loc>{escape(self.url(path))}</loc></url>\n".encode("utf-8")
+        if (
+            self._handle is None
+            or self._part_urls == self.max_urls
+            or self._part_bytes + len(entry) + len(URLSET_FOOTER) > self.max_bytes
+        ):
+            self._start_part()
+        self._handle.write(entry)
+        self._part_urls += 1
+        self._part_bytes += len(entry)
+        self.urls += 1
+
+    def _start_part(self) -> None:
+        self._end_part()
+        os.makedirs(self.directory, exist_ok=True)
+        path = os.path.join(self.directory, SITEMAP_PART_FILENAME.format(len(self.parts) + 1))
+        self.parts.append(path)
+        self._handle = open(temporary_path(path), "wb")
+        self._handle.write(URLSET_HEADER)
+        self._part_urls = 0
+        self._part_bytes = len(URLSET_HEADER)
+
+    def _end_part(self) -> None:
+        if self._handle is not None:
+            self._handle.write(URLSET_FOOTER)
+            self._handle.close()
+            self._handle = None
+
+    def finish(self) -> None:
+        """Publish the parts and the index, and delete parts left over from a larger earlier build."""
+        if not self.parts:
+            self._start_part()
+        self._end_part()
+        for path in self.parts:
+            os.replace(temporary_path(path), path)
+        entries = "".join(
+            f"<sitemap><loc>{escape(self.url(os.path.basename(path)))}</loc></sitemap>\n" for path in self.parts
+        )
+        index = f'{XML_DECLARATION}<sitemapindex xmlns="{SITEMAP_NAMESPACE}">\n{entries}</sitemapindex>\n'
+        replace_file(os.path.join(self.directory, SITEMAP_INDEX_FILENAME), index.encode("utf-8"))
+        for name in os.listdir(self.directory):
+            match = SITEMAP_PART_RE.match(name)
+            if match and int(match.group(1)) > len(self.parts):
+                os.remove(os.path.join(self.directory, name))
+
+    def abort(self) -> None:
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+        for path in self.parts:
+            try:
+                os.remove(temporary_path(path))
+            except FileNotFoundError:
+                pass
+
+
+class PageIndexWriter:
+    def __init__(self, path: str):
+        self.path = path
+        self.pages = 0
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._handle = open(temporary_path(path), "w", encoding="utf-8")
+
+    def add(self, title: str, path: str, category: str | None, data: bytes) -> None:
+        record = {
+            "title": title,
+            "path": path.replace(os.sep, "/"),
+            "category": category,
+            "sha256": hashlib.sha256(data).hexdigest(),
+        }
+        self._handle.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self.pages += 1
+
+    def finish(self) -> None:
+        self._handle.close()
+        os.replace(temporary_path(self.path), self.path)
+
+    def abort(self) -> None:
+        self._handle.close()
+        try:
+            os.remove(temporary_path(self.path))
+        except FileNotFoundError:
+            pass
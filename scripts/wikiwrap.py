@@ -0,0 +1,94 @@
+"""Fast paragraph wrapping for generated wikitext.
+
+``wrap_text`` follows ``textwrap.fill`` with its default options: the same
+word and hyphen break points and the same greedy line filling. Text with
+single spaces is chunked with ``str.split`` and hyphen splitting is only
+attempted on words that contain a hyphen, instead of running the
+general-purpose chunking regex over every paragraph. With ``keep_links``
+(the default) a ``[[...]]`` link and anything attached to it are never
+split across lines, since MediaWiki does not treat a link containing a line
+break as a link. ``keep_links=False`` gives byte-identical ``textwrap.fill``
+output.
+"""
+
+import re
+import textwrap
+
+SPACE_RUN_RE = re.compile(r"( +)")
+WHITESPACE_TABLE = str.maketrans("\t\n\x0b\x0c\r", "     ")
+HYPHEN_CHUNK_RE = textwrap.TextWrapper.wordsep_re
+LINK_SPAN_RE = re.compile(r"\[\[.*?\]\]")
+LINK_SPACE = "\x00"
+
+
+def split_chunks(text: str, keep_links: bool = True) -> list[str]:
+    """Split text into the same word and whitespace chunks textwrap produces."""
+    if not text.isprintable():
+        text = text.expandtabs().translate(WHITESPACE_TABLE)
+    protected = keep_links and "[[" in text
+    if protected:
+        # Spaces inside a link are hidden so the whole link stays one chunk.
+        text = LINK_SPAN_RE.sub(lambda match: match.group().replace(" ", LINK_SPACE), text)
+    if "  " in text:
+        tokens = SPACE_RUN_RE.split(text)
+    else:
+        # Single spaces only: interleave the words with one-space chunks.
+        words = text.split(" ")
+        tokens = [" "] * (2 * len(words) - 1)
+        tokens[::2] = words
+    if "-" in text:
+        chunks = []
+        for token in tokens:
+            if "-" in token and token[0] != " " and not (protected and "[[" in token):
+                chunks.extend(chunk for chunk in HYPHEN_CHUNK_RE.split(token) if chunk)
+            elif token:
+                chunks.append(token)
+    else:
+        chunks = [token for token in tokens if token]
+    if protected:
+        chunks = [chunk.replace(LINK_SPACE, " ") if LINK_SPACE in chunk else chunk for chunk in chunks]
+    return chunks
+
+
+def wrap_lines(text: str, width: int = 70, keep_links: bool = True) -> list[str]:
+    if width <= 0:
+        raise ValueError(f"invalid width {width!r} (must be > 0)")
+    chunks = split_chunks(text, keep_links)
+    count = len(chunks)
+    lines = []
+    position = 0
+    while position < count:
+        if lines and chunks[position][0] == " ":
+            position += 1
+            if position == count:
+                break
+        start = position
+        length = 0
+        while position < count and length + len(chunks[position]) <= width:
+            length += len(chunks[position])
+            position += 1
+        current = chunks[start:position]
+        if position < count and len(chunks[position]) > width:
+            chunk = chunks[position]
+            if keep_links and "[[" in chunk:
+                # An overlong link goes on a line of its own rather than being broken.
+                if not current:
+                    current.append(chunk)
+                    position += 1
+            else:
+                end = space_left = width - length
+                if len(chunk) > space_left:
+                    hyphen = chunk.rfind("-", 0, space_left)
+                    if hyphen > 0 and any(char != "-" for char in chunk[:hyphen]):
+                        end = hyphen + 1
+                current.append(chunk[:end])
+                chunks[position] = chunk[end:]
+        if current and current[-1][:1] in (" ", ""):
+            del current[-1]
+        if current:
+            lines.append("".join(current))
+    return lines
+
+
+def wrap_text(text: str, width: int = 70, keep_links: bool = True) -> str:
+    return "\n".join(wrap_lines(text, width, keep_links))